@@ -0,0 +1,508 @@
+import argparse
+import math
+import random
+import sys
+
+import numpy as np
+
+from bigint import basis_for_bits, rns_multiply
+from dsp import rns_dot, rns_fir, rns_matmul
+from montgomery import batch_montgomery_pow, montgomery_context, montgomery_pow
+from nonmodular import (
+    batch_compare_magnitude,
+    batch_detect_addition_overflow,
+    batch_detect_sign,
+    batch_scale_by_moduli,
+    compare_magnitude,
+    detect_addition_overflow,
+    detect_sign,
+    scale_by_moduli,
+)
+from planner import plan_moduli
+from rns import (
+    forward_conversion,
+    modular_addition,
+    modular_subtraction,
+    modular_multiplication,
+    modular_division,
+)
+from moduli import ModuliSet
+from reverse_conversion import (
+    batch_crt_reverse_conversion,
+    batch_special_reverse_conversion,
+    batch_mrc_reverse_conversion,
+    crt_reverse_conversion,
+    mrc_reverse_conversion,
+)
+from rrns import RRNSCode
+from rns_batch import (
+    batch_forward_conversion,
+    batch_modular_addition,
+    batch_modular_subtraction,
+    batch_modular_multiplication,
+    batch_modular_division,
+)
+from special_forms import (
+    special_forward_conversion,
+    special_modular_multiplication,
+    special_reverse_conversion,
+    triple_exponent,
+)
+from sticker import Tube
+from sticker_strings import separate, set_bit
+from sticker_program import StickerProgram
+from timing import DEFAULT_REGRESSION_THRESHOLD, BenchmarkSuite, compare_results, format_ns, load_results, time_call
+
+DEFAULT_MODULI = [251, 253, 255, 256, 257, 259, 263]
+CHANNEL_COUNTS = (3, 4, 8, 16, 32, 64)
+
+
+def primes_above(start, count):
+    primes = []
+    candidate = start + 1
+    while len(primes) < count:
+        if all(candidate % p for p in range(2, math.isqrt(candidate) + 1)):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+def _seconds(suite, name, func):
+    return suite.measure(name, func).median_ns / 1e9
+
+
+def benchmark_batch_engine(suite, count=100_000, moduli=DEFAULT_MODULI, seed=0):
+    rng = random.Random(seed)
+    dynamic_range = 1
+    for m in moduli:
+        dynamic_range *= m
+    xs = [rng.randrange(dynamic_range) for _ in range(count)]
+    # Divisors must be invertible in every channel
+    ys = [rng.randrange(dynamic_range) for _ in range(count)]
+    ys = [y if all(math.gcd(y, m) == 1 for m in moduli) else 1 for y in ys]
+
+    scalar_X = [forward_conversion(x, moduli) for x in xs]
+    scalar_Y = [forward_conversion(y, moduli) for y in ys]
+    batch_X = batch_forward_conversion(xs, moduli)
+    batch_Y = batch_forward_conversion(ys, moduli)
+
+    cases = [
+        ("forward", lambda: [forward_conversion(x, moduli) for x in xs],
+         lambda: batch_forward_conversion(xs, moduli)),
+    ]
+    for name, scalar_op, batch_op in [
+        ("addition", modular_addition, batch_modular_addition),
+        ("subtraction", modular_subtraction, batch_modular_subtraction),
+        ("multiplication", modular_multiplication, batch_modular_multiplication),
+        ("division", modular_division, batch_modular_division),
+    ]:
+        cases.append((
+            name,
+            lambda op=scalar_op: [op(a, b, moduli) for a, b in zip(scalar_X, scalar_Y)],
+            lambda op=batch_op: op(batch_X, batch_Y, moduli),
+        ))
+
+    rows = []
+    for name, scalar_call, batch_call in cases:
+        scalar_time = _seconds(suite, f"batch_engine/{name}/scalar", scalar_call)
+        batch_time = _seconds(suite, f"batch_engine/{name}/batch", batch_call)
+        rows.append((name, count / scalar_time, count / batch_time, scalar_time / batch_time))
+    return rows
+
+
+def benchmark_moduli_set(suite, count=100_000, moduli=DEFAULT_MODULI, seed=0):
+    rng = random.Random(seed)
+    basis = ModuliSet(moduli)
+    xs = [rng.randrange(basis.dynamic_range) for _ in range(count)]
+    ys = [rng.randrange(basis.dynamic_range) for _ in range(count)]
+    ys = [y if all(math.gcd(y, m) == 1 for m in moduli) else 1 for y in ys]
+    scalar_X = [forward_conversion(x, moduli) for x in xs]
+    scalar_Y = [forward_conversion(y, moduli) for y in ys]
+    batch_X = batch_forward_conversion(xs, basis)
+    batch_Y = batch_forward_conversion(ys, basis)
+
+    rows = []
+    for name, raw_call, basis_call in [
+        ("scalar division",
+         lambda: [modular_division(a, b, moduli) for a, b in zip(scalar_X, scalar_Y)],
+         lambda: [modular_division(a, b, basis) for a, b in zip(scalar_X, scalar_Y)]),
+        ("batch division",
+         lambda: batch_modular_division(batch_X, batch_Y, moduli),
+         lambda: batch_modular_division(batch_X, batch_Y, basis)),
+    ]:
+        raw_time = _seconds(suite, f"moduli_set/{name}/list", raw_call)
+        basis_time = _seconds(suite, f"moduli_set/{name}/moduli_set", basis_call)
+        rows.append((name, count / raw_time, count / basis_time, raw_time / basis_time))
+    return rows
+
+
+def benchmark_reverse_conversion(suite, count=10_000, channel_counts=CHANNEL_COUNTS, seed=0):
+    rng = random.Random(seed)
+    rows = []
+    for channels in channel_counts:
+        basis = ModuliSet(primes_above(2 ** 15, channels))
+        xs = [rng.randrange(basis.dynamic_range) for _ in range(count)]
+        residues = [forward_conversion(x, basis) for x in xs]
+        matrix = batch_forward_conversion(xs, basis)
+        rates = []
+        for name, call in (
+            ("crt", lambda: [crt_reverse_conversion(r, basis) for r in residues]),
+            ("mrc", lambda: [mrc_reverse_conversion(r, basis) for r in residues]),
+            ("batch_crt", lambda: batch_crt_reverse_conversion(matrix, basis)),
+            ("batch_mrc", lambda: batch_mrc_reverse_conversion(matrix, basis)),
+        ):
+            rates.append(count / _seconds(suite, f"reverse_conversion/{channels}/{name}", call))
+        rows.append((channels, *rates))
+    return rows
+
+
+def _corrupt(code, residues, positions, rng):
+    corrupted = list(residues)
+    for p in positions:
+        corrupted[p] = (corrupted[p] + rng.randrange(1, code.moduli[p])) % code.moduli[p]
+    return corrupted
+
+
+def benchmark_rrns_localization(suite, trials=200, channel_counts=(8, 12, 16, 24, 32, 48), redundancy=4,
+                                engines=("search", "syndrome"), seed=0):
+    rows = []
+    for channels in channel_counts:
+        primes = primes_above(2 ** 8, channels)
+        row = [channels]
+        for errors in (1, 2):
+            for engine in engines:
+                code = RRNSCode(primes[:-redundancy], primes[-redundancy:], engine)
+                rng = random.Random(seed)
+                vectors = [
+                    _corrupt(code, code.encode(rng.randrange(code.legitimate_range)),
+                             rng.sample(range(channels), errors), rng)
+                    for _ in range(trials)
+                ]
+                # Warm the per-code subset caches before timing
+                for vector in vectors:
+                    code.decode(vector)
+                elapsed = _seconds(suite, f"rrns/{channels}/{errors}/{engine}",
+                                   lambda: [code.decode(v) for v in vectors])
+                row.append(elapsed / trials * 1e6)
+        rows.append(tuple(row))
+    return rows
+
+
+def benchmark_sticker_tube(suite, strand_counts=(1_000, 10_000, 100_000, 1_000_000), length=64,
+                           string_limit=100_000, seed=0):
+    rows = []
+    for count in strand_counts:
+        tube = Tube.random(count, length, seed)
+        bit = length // 2
+        row = [count]
+        strands = tube.to_strings() if count <= string_limit else None
+        for name, string_call, tube_call in (
+            ("set", lambda: set_bit(strands, bit), lambda: tube.set_bit(bit)),
+            ("separate", lambda: separate(strands, bit), lambda: tube.separate(bit)),
+        ):
+            if strands is None:
+                row.append(None)
+            else:
+                row.append(_seconds(suite, f"sticker/{count}/{name}/string", string_call) * 1e3)
+            row.append(_seconds(suite, f"sticker/{count}/{name}/tube", tube_call) * 1e3)
+        rows.append(tuple(row))
+    return rows
+
+
+def _filter_chain_eager(tube, steps, length):
+    for i in range(steps):
+        on, off = tube.separate(i)
+        off.discard()
+        tube = on.set_bit(length - 1 - i)
+    return tube
+
+
+def _filter_chain_program(steps, length):
+    program = StickerProgram(length)
+    tube = program.input()
+    for i in range(steps):
+        on, off = program.separate(tube, i)
+        program.discard(off)
+        tube = program.set(on, length - 1 - i)
+    program.output(tube, "result")
+    return program
+
+
+def benchmark_sticker_program(suite, strand_counts=(10_000, 100_000, 1_000_000), length=64, steps=8, seed=0):
+    rows = []
+    for count in strand_counts:
+        tube = Tube.random(count, length, seed)
+        program = _filter_chain_program(steps, length)
+        eager = _seconds(suite, f"sticker_program/{count}/eager",
+                         lambda: _filter_chain_eager(tube.copy(), steps, length))
+        lazy = _seconds(suite, f"sticker_program/{count}/program", lambda: program.run(tube))
+        rows.append((count, eager * 1e3, lazy * 1e3, eager / lazy))
+    return rows
+
+
+def benchmark_bigint_multiplication(suite, sizes=(10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6), seed=0):
+    rng = random.Random(seed)
+    rows = []
+    for bits in sizes:
+        a, b = rng.getrandbits(bits) | 1 << (bits - 1), rng.getrandbits(bits) | 1 << (bits - 1)
+        # Basis constants are cached per channel count, so report their one-off cost separately
+        basis, setup_ns = time_call(basis_for_bits, 2 * bits)
+        X = basis.forward([a, b])
+        builtin = _seconds(suite, f"bigint/{bits}/int", lambda: a * b)
+        channels = _seconds(suite, f"bigint/{bits}/channels", lambda: basis.multiply(X[0], X[1]))
+        full = _seconds(suite, f"bigint/{bits}/rns", lambda: rns_multiply(a, b))
+        rows.append((bits, len(basis), setup_ns / 1e6, builtin * 1e3, channels * 1e3, full * 1e3, full / builtin))
+    return rows
+
+
+def benchmark_dsp(suite, count=100_000, matrix_size=128, taps=32, moduli=DEFAULT_MODULI, value_bits=12, seed=0):
+    # Kernels run on residues already in the RNS domain. The baseline is the
+    # same computation on plain int64 values, kept small enough not to wrap.
+    rng = np.random.default_rng(seed)
+    basis = ModuliSet(moduli)
+    xs = rng.integers(0, 2 ** value_bits, count, dtype=np.int64)
+    ys = rng.integers(0, 2 ** value_bits, count, dtype=np.int64)
+    A = rng.integers(0, 2 ** value_bits, (matrix_size, matrix_size), dtype=np.int64)
+    B = rng.integers(0, 2 ** value_bits, (matrix_size, matrix_size), dtype=np.int64)
+    hs = rng.integers(0, 2 ** value_bits, taps, dtype=np.int64)
+    signal = xs[:count // 10]
+    X, Y = batch_forward_conversion(xs, basis), batch_forward_conversion(ys, basis)
+    RA = batch_forward_conversion(A.reshape(-1), basis).reshape(matrix_size, matrix_size, -1)
+    RB = batch_forward_conversion(B.reshape(-1), basis).reshape(matrix_size, matrix_size, -1)
+    H, S = batch_forward_conversion(hs, basis), batch_forward_conversion(signal, basis)
+
+    rows = []
+    for name, size, baseline_call, rns_call in [
+        ("dot", f"{count:,}", lambda: np.dot(xs, ys), lambda: rns_dot(X, Y, basis)),
+        ("matmul", f"{matrix_size}^3", lambda: A @ B, lambda: rns_matmul(RA, RB, basis)),
+        ("fir", f"{len(signal):,}x{taps}", lambda: np.convolve(signal, hs)[:len(signal)],
+         lambda: rns_fir(S, H, basis)),
+    ]:
+        baseline = _seconds(suite, f"dsp/{name}/numpy", baseline_call)
+        rns = _seconds(suite, f"dsp/{name}/rns", rns_call)
+        rows.append((name, size, len(basis), baseline * 1e3, rns * 1e3, rns / baseline))
+    return rows
+
+
+def benchmark_montgomery_pow(suite, bit_sizes=(512, 1024, 2048), count=64, seed=0):
+    rng = random.Random(seed)
+    rows = []
+    for bits in bit_sizes:
+        modulus = rng.getrandbits(bits) | 1 | 1 << (bits - 1)
+        exponent = rng.getrandbits(bits)
+        bases = [rng.randrange(modulus) for _ in range(count)]
+        context = montgomery_context(modulus)
+        builtin = _seconds(suite, f"montgomery/{bits}/pow", lambda: [pow(b, exponent, modulus) for b in bases])
+        single = _seconds(suite, f"montgomery/{bits}/rns", lambda: montgomery_pow(bases[0], exponent, modulus))
+        batch = _seconds(suite, f"montgomery/{bits}/rns_batch",
+                         lambda: batch_montgomery_pow(bases, exponent, modulus))
+        rows.append((bits, context.channels, builtin / count * 1e3, single * 1e3, batch / count * 1e3,
+                     builtin / batch))
+    return rows
+
+
+def benchmark_nonmodular(suite, count=10_000, moduli=DEFAULT_MODULI, seed=0):
+    rng = random.Random(seed)
+    basis = ModuliSet(moduli)
+    xs = [rng.randrange(basis.dynamic_range) for _ in range(count)]
+    ys = [rng.randrange(basis.dynamic_range) for _ in range(count)]
+    scalar_X = [forward_conversion(x, basis) for x in xs]
+    scalar_Y = [forward_conversion(y, basis) for y in ys]
+    batch_X = batch_forward_conversion(xs, basis)
+    batch_Y = batch_forward_conversion(ys, basis)
+    count_scaled = len(basis) // 2
+
+    rows = []
+    for name, scalar_call, batch_call in [
+        ("compare",
+         lambda: [compare_magnitude(a, b, basis) for a, b in zip(scalar_X, scalar_Y)],
+         lambda: batch_compare_magnitude(batch_X, batch_Y, basis)),
+        ("sign",
+         lambda: [detect_sign(a, basis) for a in scalar_X],
+         lambda: batch_detect_sign(batch_X, basis)),
+        ("overflow",
+         lambda: [detect_addition_overflow(a, b, basis) for a, b in zip(scalar_X, scalar_Y)],
+         lambda: batch_detect_addition_overflow(batch_X, batch_Y, basis)),
+        ("scale",
+         lambda: [scale_by_moduli(a, basis, count_scaled) for a in scalar_X],
+         lambda: batch_scale_by_moduli(batch_X, basis, count_scaled)),
+    ]:
+        scalar_time = _seconds(suite, f"nonmodular/{name}/scalar", scalar_call)
+        batch_time = _seconds(suite, f"nonmodular/{name}/batch", batch_call)
+        rows.append((name, scalar_time / count * 1e6, batch_time / count * 1e6, scalar_time / batch_time))
+    return rows
+
+
+def benchmark_planner(suite, range_bits=(16, 64, 256, 1024), redundancies=(0, 2), word_bits=16):
+    rows = []
+    for bits in range_bits:
+        for redundancy in redundancies:
+            plan = plan_moduli(2 ** bits, redundancy, word_bits)
+            elapsed = _seconds(suite, f"planner/{bits}/{redundancy}",
+                               lambda: plan_moduli(2 ** bits, redundancy, word_bits))
+            rows.append((bits, redundancy, elapsed * 1e3, len(plan.basis), plan.cost, plan.strategy))
+    return rows
+
+
+def benchmark_special_forms(suite, exponents=(16, 64, 512, 1024), value_bits=100_000, count=100_000,
+                            batch_exponents=(8, 16, 20, 30), seed=0):
+    # Generic `%` paths against the {2^n - 1, 2^n, 2^n + 1} kernels, called directly
+    rng = random.Random(seed)
+    rows = []
+    for n in exponents:
+        moduli = [2 ** n - 1, 2 ** n, 2 ** n + 1]
+        triple = triple_exponent(moduli)
+        X = rng.getrandbits(value_bits)
+        x, y = rng.randrange(math.prod(moduli)), rng.randrange(math.prod(moduli))
+        rx, ry = [x % m for m in moduli], [y % m for m in moduli]
+        for name, generic_call, special_call in (
+            (f"forward {value_bits:,}-bit", lambda: [X % m for m in moduli],
+             lambda: special_forward_conversion(X, triple)),
+            ("multiplication", lambda: [a * b % m for a, b, m in zip(rx, ry, moduli)],
+             lambda: special_modular_multiplication(rx, ry, triple)),
+            ("reverse", lambda: crt_reverse_conversion(rx, moduli), lambda: special_reverse_conversion(rx, triple)),
+        ):
+            generic = _seconds(suite, f"special_forms/int/{n}/{name}/generic", generic_call)
+            special = _seconds(suite, f"special_forms/int/{n}/{name}/special", special_call)
+            rows.append((f"int n={n}", name, generic * 1e6, special * 1e6, generic / special))
+
+    for n in batch_exponents:
+        moduli = [2 ** n - 1, 2 ** n, 2 ** n + 1]
+        basis = ModuliSet(moduli)
+        triple = triple_exponent(moduli)
+        X = batch_forward_conversion([rng.randrange(basis.dynamic_range) for _ in range(count)], basis)
+        # Only reverse conversion has a batch kernel: NumPy's int64 `%` is a
+        # single pass and beats fold chains for forward conversion and arithmetic
+        generic = _seconds(suite, f"special_forms/batch/{n}/reverse/generic",
+                           lambda: batch_crt_reverse_conversion(X, basis))
+        special = _seconds(suite, f"special_forms/batch/{n}/reverse/special",
+                           lambda: batch_special_reverse_conversion(X, triple))
+        rows.append((f"batch n={n}", f"reverse {count:,} rows", generic * 1e6, special * 1e6, generic / special))
+    return rows
+
+
+def _print_batch_engine(rows):
+    print(f"{'operation':<16}{'scalar ops/s':>16}{'batch ops/s':>16}{'speedup':>10}")
+    for name, scalar_rate, batch_rate, speedup in rows:
+        print(f"{name:<16}{scalar_rate:>16,.0f}{batch_rate:>16,.0f}{speedup:>9.1f}x")
+
+
+def _print_moduli_set(rows):
+    print(f"{'operation':<18}{'list ops/s':>16}{'ModuliSet ops/s':>18}{'speedup':>10}")
+    for name, raw_rate, basis_rate, speedup in rows:
+        print(f"{name:<18}{raw_rate:>16,.0f}{basis_rate:>18,.0f}{speedup:>9.1f}x")
+
+
+def _print_reverse_conversion(rows):
+    print(f"{'channels':>8}{'CRT ops/s':>14}{'MRC ops/s':>14}{'batch CRT ops/s':>18}{'batch MRC ops/s':>18}")
+    for channels, crt, mrc, batch_crt, batch_mrc in rows:
+        print(f"{channels:>8}{crt:>14,.0f}{mrc:>14,.0f}{batch_crt:>18,.0f}{batch_mrc:>18,.0f}")
+
+
+def _print_rrns_localization(rows):
+    print(f"{'channels':>8}{'1 err search us':>18}{'1 err syndrome us':>20}"
+          f"{'2 err search us':>18}{'2 err syndrome us':>20}")
+    for channels, *latencies in rows:
+        print(f"{channels:>8}" + "".join(f"{t:>{w},.1f}" for t, w in zip(latencies, (18, 20, 18, 20))))
+
+
+def _print_sticker_tube(rows):
+    print(f"{'strands':>10}{'string set ms':>16}{'tube set ms':>14}{'string sep ms':>16}{'tube sep ms':>14}")
+    for count, *times in rows:
+        cells = "".join("-".rjust(w) if t is None else f"{t:>{w},.3f}" for t, w in zip(times, (16, 14, 16, 14)))
+        print(f"{count:>10,}{cells}")
+
+
+def _print_sticker_program(rows):
+    print(f"{'strands':>10}{'eager ms':>12}{'program ms':>12}{'speedup':>10}")
+    for count, eager, lazy, speedup in rows:
+        print(f"{count:>10,}{eager:>12,.3f}{lazy:>12,.3f}{speedup:>9.1f}x")
+
+
+def _print_bigint_multiplication(rows):
+    print(f"{'bits':>10}{'channels':>10}{'setup ms':>12}{'int ms':>12}{'channel ms':>12}{'rns ms':>12}{'rns/int':>10}")
+    for bits, channels, setup, builtin, channel, full, ratio in rows:
+        print(f"{bits:>10,}{channels:>10,}{setup:>12,.3f}{builtin:>12,.3f}{channel:>12,.3f}{full:>12,.3f}{ratio:>9.1f}x")
+
+
+def _print_montgomery_pow(rows):
+    print(f"{'bits':>6}{'channels':>10}{'pow ms':>12}{'rns ms':>12}{'batch ms/op':>14}{'batch speedup':>15}")
+    for bits, channels, builtin, single, batch, speedup in rows:
+        print(f"{bits:>6}{channels:>10}{builtin:>12,.3f}{single:>12,.3f}{batch:>14,.3f}{speedup:>14.1f}x")
+
+
+def _print_nonmodular(rows):
+    print(f"{'operation':<12}{'scalar us/op':>14}{'batch us/op':>14}{'speedup':>10}")
+    for name, scalar, batch, speedup in rows:
+        print(f"{name:<12}{scalar:>14,.3f}{batch:>14,.3f}{speedup:>9.1f}x")
+
+
+def _print_planner(rows):
+    print(f"{'range bits':>10}{'redundancy':>12}{'plan ms':>10}{'channels':>10}{'cost':>10}  strategy")
+    for bits, redundancy, elapsed, channels, cost, strategy in rows:
+        print(f"{bits:>10}{redundancy:>12}{elapsed:>10,.3f}{channels:>10}{cost:>10,.2f}  {strategy}")
+
+
+def _print_special_forms(rows):
+    print(f"{'input':<14}{'operation':<24}{'generic us':>14}{'special us':>14}{'speedup':>10}")
+    for case, name, generic, special, speedup in rows:
+        print(f"{case:<14}{name:<24}{generic:>14,.3f}{special:>14,.3f}{speedup:>9.1f}x")
+
+
+def _print_dsp(rows):
+    print(f"{'kernel':<8}{'size':>14}{'channels':>10}{'numpy ms':>12}{'rns ms':>12}{'rns/numpy':>11}")
+    for name, size, channels, baseline, rns, ratio in rows:
+        print(f"{name:<8}{size:>14}{channels:>10}{baseline:>12,.3f}{rns:>12,.3f}{ratio:>10.1f}x")
+
+
+def _print_comparison(rows):
+    print(f"{'benchmark':<40}{'baseline':>14}{'current':>14}{'ratio':>8}")
+    for name, old, new, ratio, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{name:<40}{format_ns(old):>14}{format_ns(new):>14}{ratio:>8.2f}{flag}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="RNS throughput benchmarks")
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5, help="timed samples per benchmark")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed calls before sampling")
+    parser.add_argument("--json", metavar="PATH", help="write machine-readable results")
+    parser.add_argument("--compare", metavar="BASELINE", help="flag regressions against a previous --json run")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD)
+    args = parser.parse_args()
+
+    suite = BenchmarkSuite(repeat=args.repeat, warmup=args.warmup)
+    _print_batch_engine(benchmark_batch_engine(suite, args.count))
+    print()
+    _print_moduli_set(benchmark_moduli_set(suite, args.count))
+    print()
+    _print_reverse_conversion(benchmark_reverse_conversion(suite, args.count // 10))
+    print()
+    _print_rrns_localization(benchmark_rrns_localization(suite))
+    print()
+    _print_nonmodular(benchmark_nonmodular(suite, args.count // 10))
+    print()
+    _print_planner(benchmark_planner(suite))
+    print()
+    _print_special_forms(benchmark_special_forms(suite, count=args.count))
+    print()
+    _print_sticker_tube(benchmark_sticker_tube(suite))
+    print()
+    _print_sticker_program(benchmark_sticker_program(suite))
+    print()
+    _print_bigint_multiplication(benchmark_bigint_multiplication(suite))
+    print()
+    _print_montgomery_pow(benchmark_montgomery_pow(suite))
+    print()
+    _print_dsp(benchmark_dsp(suite, args.count))
+
+    if args.json:
+        suite.write_json(args.json)
+    if args.compare:
+        rows = compare_results(load_results(args.compare),
+                               {r["name"]: r for r in suite.to_dict()["results"]}, args.threshold)
+        print()
+        _print_comparison(rows)
+        if any(regressed for *_, regressed in rows):
+            sys.exit(1)
@@ -0,0 +1,199 @@
+import math
+from functools import lru_cache
+
+import numpy as np
+
+# Channel moduli are primes just below 2**31, so a channel product fits in uint64
+WORD_MODULUS_BITS = 31
+# Operands are split into 16-bit limbs. A block of BLOCK_LIMBS limbs is reduced
+# with one float64 matrix product, which stays exact because each term is below
+# 2**31 and a block sum is below 2**39.
+LIMB_BITS = 16
+BLOCK_LIMBS = 256
+# Channels are processed in slices so the per-block power tables stay small
+CHANNEL_SLICE = 4096
+SIEVE_SEGMENT = 1 << 20
+
+_primes_below = {}
+
+
+def _small_primes(limit):
+    sieve = np.ones(limit + 1, dtype=bool)
+    sieve[:2] = False
+    for p in range(2, math.isqrt(limit) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = False
+    return np.flatnonzero(sieve)
+
+
+def primes_below(limit, count):
+    # Largest primes below limit, in descending order
+    primes = _primes_below.setdefault(limit, [])
+    if count > len(primes):
+        small = _small_primes(math.isqrt(limit)).tolist()
+        top = primes[-1] if primes else limit
+        while len(primes) < count:
+            low = max(top - SIEVE_SEGMENT, small[-1] + 1)
+            if low >= top:
+                raise ValueError(f"Not enough primes below {limit} for {count} channels.")
+            segment = np.ones(top - low, dtype=bool)
+            for p in small:
+                segment[(-low) % p::p] = False
+            primes.extend((np.flatnonzero(segment)[::-1] + low).tolist())
+            top = low
+    return primes[:count]
+
+
+def word_primes(count):
+    return primes_below(1 << WORD_MODULUS_BITS, count)
+
+
+class BigIntBasis:
+    def __init__(self, count):
+        self.moduli = tuple(word_primes(count))
+        self.row = np.array(self.moduli, dtype=np.uint64)
+        # Product tree: levels[0] are the moduli, levels[-1] == [dynamic_range]
+        self.levels = [list(self.moduli)]
+        while len(self.levels[-1]) > 1:
+            level = self.levels[-1]
+            self.levels.append([level[i] * level[i + 1] if i + 1 < len(level) else level[i]
+                                for i in range(0, len(level), 2)])
+        self.dynamic_range = self.levels[-1][0]
+        # Each value below 2**capacity_bits round-trips exactly
+        self.capacity_bits = self.dynamic_range.bit_length() - 1
+        weights = self._weights_mod_moduli()
+        self.crt_inverse_row = np.array([pow(w, -1, m) for w, m in zip(weights, self.moduli)], dtype=np.uint64)
+
+    def _weights_mod_moduli(self):
+        # Remainder tree: carry (M / node) mod node down from the root, so the
+        # leaves end up with (M / m_i) mod m_i without any division of M itself
+        outside = [1]
+        for depth in range(len(self.levels) - 2, -1, -1):
+            level = self.levels[depth]
+            children = []
+            for i, node in enumerate(level):
+                sibling = i ^ 1
+                parent_outside = outside[i // 2]
+                if sibling < len(level):
+                    children.append(parent_outside * level[sibling] % node)
+                else:
+                    children.append(parent_outside % node)
+            outside = children
+        return outside
+
+    def __len__(self):
+        return len(self.moduli)
+
+    def __repr__(self):
+        return f"BigIntBasis(channels={len(self)}, capacity_bits={self.capacity_bits})"
+
+    def forward(self, values):
+        # Non-negative ints -> (len(values), channels) uint64 residue matrix
+        values = [int(v) for v in values]
+        if any(v < 0 for v in values):
+            raise ValueError("Big-integer residues are defined for non-negative values only.")
+        limb_bytes = LIMB_BITS // 8
+        block_bytes = BLOCK_LIMBS * limb_bytes
+        size = max(max((v.bit_length() for v in values), default=0), 1)
+        blocks = -(-size // (8 * block_bytes))
+        raw = b"".join(v.to_bytes(blocks * block_bytes, "little") for v in values)
+        limbs = np.frombuffer(raw, dtype=f"<u{limb_bytes}").astype(np.float64).reshape(-1, BLOCK_LIMBS)
+
+        residues = np.empty((len(values), len(self.moduli)), dtype=np.uint64)
+        limb_step = np.uint64(1 << LIMB_BITS)
+        low_mask = np.uint64((1 << LIMB_BITS) - 1)
+        for start in range(0, len(self.moduli), CHANNEL_SLICE):
+            m = self.row[start:start + CHANNEL_SLICE]
+            powers = np.empty((BLOCK_LIMBS, len(m)), dtype=np.uint64)
+            powers[0] = 1
+            for i in range(1, BLOCK_LIMBS):
+                powers[i] = powers[i - 1] * limb_step % m
+            block_step = powers[-1] * limb_step % m
+            # Split the powers into 16-bit halves to keep the float sums exact
+            high = (limbs @ (powers >> np.uint64(LIMB_BITS)).astype(np.float64)).astype(np.uint64) % m
+            low = (limbs @ (powers & low_mask).astype(np.float64)).astype(np.uint64) % m
+            partial = ((high << np.uint64(LIMB_BITS)) + low) % m
+            partial = partial.reshape(len(values), blocks, len(m))
+            # Horner over blocks, most significant first
+            acc = np.zeros((len(values), len(m)), dtype=np.uint64)
+            for b in range(blocks - 1, -1, -1):
+                acc = (acc * block_step + partial[:, b]) % m
+            residues[:, start:start + len(m)] = acc
+        return residues
+
+    def reverse(self, residues):
+        # (channels,) vector -> int, or (n, channels) matrix -> list of ints
+        residues = np.asarray(residues, dtype=np.uint64)
+        if residues.ndim == 1:
+            return self._reverse_one(residues)
+        return [self._reverse_one(row) for row in residues]
+
+    def _reverse_one(self, residues):
+        if residues.shape != self.row.shape:
+            raise ValueError("Residue vector does not match the basis.")
+        # CRT: X = sum(t_i * M / m_i) - alpha * M with t_i = r_i * c_i mod m_i.
+        # The weighted sum is folded up the product tree, so only big-by-big
+        # multiplications are needed, and alpha comes from sum(t_i / m_i).
+        t = residues % self.row * self.crt_inverse_row % self.row
+        alpha = int(math.floor(math.fsum((t / self.row).tolist())))
+        sums = t.tolist()
+        for level in self.levels[:-1]:
+            sums = [sums[i] * level[i + 1] + sums[i + 1] * level[i] if i + 1 < len(level) else sums[i]
+                    for i in range(0, len(level), 2)]
+        value = sums[0] - alpha * self.dynamic_range
+        # The float estimate of alpha is off by at most one
+        if value < 0:
+            value += self.dynamic_range
+        elif value >= self.dynamic_range:
+            value -= self.dynamic_range
+        return value
+
+    def multiply(self, X, Y):
+        # Channel-wise product of two residue matrices (or vectors)
+        return X * Y % self.row
+
+
+def channels_for_bits(bits):
+    # Moduli are all above 2**30.99, so this never undershoots. The count is
+    # rounded up to 1/8 of its power of two to keep the number of cached bases small.
+    needed = max(1, math.ceil((bits + 1) / (WORD_MODULUS_BITS - 0.01)))
+    grain = max(1, (1 << (needed.bit_length() - 1)) // 8)
+    return -(-needed // grain) * grain
+
+
+@lru_cache(maxsize=16)
+def _basis(count):
+    return BigIntBasis(count)
+
+
+def basis_for_bits(bits):
+    basis = _basis(channels_for_bits(bits))
+    if basis.capacity_bits < bits:
+        raise ValueError(f"Basis of {len(basis)} channels cannot hold {bits}-bit values.")
+    return basis
+
+
+def rns_multiply(a, b):
+    a, b = int(a), int(b)
+    sign = -1 if (a < 0) != (b < 0) else 1
+    a, b = abs(a), abs(b)
+    if not a or not b:
+        return 0
+    basis = basis_for_bits(a.bit_length() + b.bit_length())
+    X = basis.forward([a, b])
+    return sign * basis.reverse(basis.multiply(X[0], X[1]))
+
+
+def batch_rns_multiply(xs, ys):
+    xs, ys = [int(x) for x in xs], [int(y) for y in ys]
+    if len(xs) != len(ys):
+        raise ValueError("Operand lists must have the same length.")
+    if not xs:
+        return []
+    signs = [-1 if (x < 0) != (y < 0) else 1 for x, y in zip(xs, ys)]
+    xs, ys = [abs(x) for x in xs], [abs(y) for y in ys]
+    basis = basis_for_bits(max(x.bit_length() + y.bit_length() for x, y in zip(xs, ys)))
+    # One forward pass for both operand lists shares the power tables
+    residues = basis.forward(xs + ys)
+    products = basis.reverse(basis.multiply(residues[:len(xs)], residues[len(xs):]))
+    return [sign * p for sign, p in zip(signs, products)]
@@ -0,0 +1,279 @@
+import os
+import random
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from rrns import STATUS_CORRECTED, STATUS_OK, RRNSCode
+
+# Latency histogram buckets are powers of two in nanoseconds
+HISTOGRAM_BUCKETS = 64
+DEFAULT_SHARD_SIZE = 10_000
+STATUS_MISCORRECTED = "miscorrected"
+
+# An error count alone means that many channels chosen uniformly at random.
+# Patterns also cover bursts of adjacent channels and fixed positions.
+ErrorPattern = namedtuple("ErrorPattern", ["kind", "count", "positions"])
+PATTERN_KINDS = ("random", "burst", "fixed")
+
+
+def random_errors(count):
+    return ErrorPattern("random", count, ())
+
+
+def burst_errors(count):
+    return ErrorPattern("burst", count, ())
+
+
+def fixed_errors(positions):
+    positions = tuple(sorted(set(positions)))
+    return ErrorPattern("fixed", len(positions), positions)
+
+
+def as_error_pattern(errors):
+    if isinstance(errors, ErrorPattern):
+        if errors.kind not in PATTERN_KINDS:
+            raise ValueError(f"Unknown error pattern: {errors.kind}")
+        return errors
+    return random_errors(int(errors))
+
+
+def pattern_label(errors):
+    pattern = as_error_pattern(errors)
+    if pattern.kind == "random":
+        return str(pattern.count)
+    if pattern.kind == "burst":
+        return f"burst {pattern.count}"
+    return "fixed " + ",".join(map(str, pattern.positions))
+
+
+def _check_pattern(pattern, n):
+    if not 0 <= pattern.count <= n:
+        raise ValueError(f"Cannot inject {pattern.count} errors into a code of length {n}.")
+    if any(not 0 <= p < n for p in pattern.positions):
+        raise ValueError(f"Error positions must lie in [0, {n}).")
+
+
+def error_positions(pattern, n, rng):
+    if pattern.kind == "random":
+        return rng.sample(range(n), pattern.count)
+    if pattern.kind == "burst":
+        start = rng.randrange(n - pattern.count + 1)
+        return range(start, start + pattern.count)
+    return pattern.positions
+
+
+class CampaignStats:
+    def __init__(self):
+        self.trials = 0
+        self.clean = 0
+        self.corrected = 0
+        self.miscorrected = 0
+        self.detected = 0
+        self.undetected = 0
+        self.false_alarms = 0
+        self.latency_total_ns = 0
+        self.latency_min_ns = None
+        self.latency_max_ns = 0
+        self.histogram = [0] * HISTOGRAM_BUCKETS
+
+    def record(self, injected_errors, outcome, latency_ns):
+        self.trials += 1
+        if injected_errors == 0:
+            if outcome == STATUS_OK:
+                self.clean += 1
+            else:
+                self.false_alarms += 1
+        elif outcome == STATUS_OK:
+            self.undetected += 1
+        elif outcome == STATUS_CORRECTED:
+            self.corrected += 1
+        elif outcome == STATUS_MISCORRECTED:
+            self.miscorrected += 1
+        else:
+            self.detected += 1
+
+        self.latency_total_ns += latency_ns
+        if self.latency_min_ns is None or latency_ns < self.latency_min_ns:
+            self.latency_min_ns = latency_ns
+        self.latency_max_ns = max(self.latency_max_ns, latency_ns)
+        self.histogram[min(latency_ns.bit_length(), HISTOGRAM_BUCKETS - 1)] += 1
+
+    def merge(self, other):
+        for name in ("trials", "clean", "corrected", "miscorrected", "detected", "undetected",
+                     "false_alarms", "latency_total_ns"):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        if other.latency_min_ns is not None:
+            if self.latency_min_ns is None or other.latency_min_ns < self.latency_min_ns:
+                self.latency_min_ns = other.latency_min_ns
+        self.latency_max_ns = max(self.latency_max_ns, other.latency_max_ns)
+        self.histogram = [a + b for a, b in zip(self.histogram, other.histogram)]
+        return self
+
+    @property
+    def faulty_trials(self):
+        return self.trials - self.clean - self.false_alarms
+
+    @property
+    def detection_rate(self):
+        faulty = self.faulty_trials
+        return (faulty - self.undetected) / faulty if faulty else 1.0
+
+    @property
+    def correction_rate(self):
+        faulty = self.faulty_trials
+        return self.corrected / faulty if faulty else 1.0
+
+    @property
+    def miscorrection_rate(self):
+        faulty = self.faulty_trials
+        return self.miscorrected / faulty if faulty else 0.0
+
+    @property
+    def mean_latency_ns(self):
+        return self.latency_total_ns / self.trials if self.trials else 0.0
+
+    def latency_percentile_ns(self, percentile):
+        # Upper edge of the bucket holding the requested rank
+        if not self.trials:
+            return 0
+        rank = percentile / 100 * self.trials
+        seen = 0
+        for bucket, count in enumerate(self.histogram):
+            seen += count
+            if count and seen >= rank:
+                return min(1 << bucket, self.latency_max_ns)
+        return self.latency_max_ns
+
+    def to_dict(self):
+        return {
+            "trials": self.trials,
+            "clean": self.clean,
+            "corrected": self.corrected,
+            "miscorrected": self.miscorrected,
+            "detected": self.detected,
+            "undetected": self.undetected,
+            "false_alarms": self.false_alarms,
+            "detection_rate": self.detection_rate,
+            "correction_rate": self.correction_rate,
+            "miscorrection_rate": self.miscorrection_rate,
+            "latency_mean_ns": self.mean_latency_ns,
+            "latency_min_ns": self.latency_min_ns,
+            "latency_max_ns": self.latency_max_ns,
+            "latency_p50_ns": self.latency_percentile_ns(50),
+            "latency_p99_ns": self.latency_percentile_ns(99),
+            "histogram": list(self.histogram),
+        }
+
+    def __repr__(self):
+        return (f"CampaignStats(trials={self.trials}, detection_rate={self.detection_rate:.4f}, "
+                f"miscorrection_rate={self.miscorrection_rate:.4f}, "
+                f"mean_latency_ns={self.mean_latency_ns:.0f})")
+
+
+def shard_seed(seed, code_index, errors, shard_index):
+    # Seeds depend on the shard, not the worker, so results are reproducible for any pool size.
+    # A random pattern seeds exactly like its bare error count.
+    pattern = as_error_pattern(errors)
+    entropy = [seed, code_index, pattern.count, shard_index]
+    if pattern.kind != "random":
+        entropy += [PATTERN_KINDS.index(pattern.kind), *pattern.positions]
+    return int(np.random.SeedSequence(entropy).generate_state(1)[0])
+
+
+_worker_codes = {}
+
+
+def _worker_code(info, redundant, engine):
+    key = (info, redundant, engine)
+    code = _worker_codes.get(key)
+    if code is None:
+        code = RRNSCode(info, redundant, engine)
+        _worker_codes[key] = code
+    return code
+
+
+def run_shard(info, redundant, engine, errors, trials, seed):
+    code = _worker_code(info, redundant, engine)
+    pattern = as_error_pattern(errors)
+    rng = random.Random(seed)
+    stats = CampaignStats()
+    n = len(code.moduli)
+    _check_pattern(pattern, n)
+    clock = time.perf_counter_ns
+    for _ in range(trials):
+        X = rng.randrange(code.legitimate_range)
+        received = code.encode(X)
+        for p in error_positions(pattern, n, rng):
+            received[p] = (received[p] + rng.randrange(1, code.moduli[p])) % code.moduli[p]
+
+        start = clock()
+        result = code.decode(received)
+        latency = clock() - start
+
+        outcome = result.status
+        if outcome == STATUS_CORRECTED and result.value != X:
+            outcome = STATUS_MISCORRECTED
+        stats.record(pattern.count, outcome, latency)
+    return stats
+
+
+def _campaign_shards(codes, error_counts, trials, shard_size, seed):
+    for code_index, (info, redundant) in enumerate(codes):
+        for errors in error_counts:
+            shard_index, remaining = 0, trials
+            while remaining > 0:
+                size = min(shard_size, remaining)
+                yield (code_index, errors), (tuple(info), tuple(redundant), errors, size,
+                                             shard_seed(seed, code_index, errors, shard_index))
+                shard_index += 1
+                remaining -= size
+
+
+def campaign_shard_count(codes, error_counts, trials, shard_size=DEFAULT_SHARD_SIZE):
+    return len(codes) * len(error_counts) * -(-trials // shard_size)
+
+
+def iter_campaign(codes, error_counts=(1, 2), trials=1_000_000, workers=None, seed=0,
+                  shard_size=DEFAULT_SHARD_SIZE, engine="syndrome"):
+    # Yields ((code_index, errors), shard stats) as shards finish. Closing
+    # the generator early drops the shards that have not started.
+    for info, redundant in codes:
+        for errors in error_counts:
+            _check_pattern(as_error_pattern(errors), len(info) + len(redundant))
+    shards = list(_campaign_shards(codes, error_counts, trials, shard_size, seed))
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        for key, (info, redundant, errors, size, shard) in shards:
+            yield key, run_shard(info, redundant, engine, errors, size, shard)
+        return
+
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = {
+            pool.submit(run_shard, info, redundant, engine, errors, size, shard): key
+            for key, (info, redundant, errors, size, shard) in shards
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def run_campaign(codes, error_counts=(1, 2), trials=1_000_000, workers=None, seed=0,
+                 shard_size=DEFAULT_SHARD_SIZE, engine="syndrome", progress=None):
+    # codes: sequence of (info_moduli, redundant_moduli) pairs; error_counts
+    # holds error counts or ErrorPatterns
+    results = {}
+    for code_index in range(len(codes)):
+        for errors in error_counts:
+            results[(code_index, errors)] = CampaignStats()
+
+    for key, stats in iter_campaign(codes, error_counts, trials, workers, seed, shard_size, engine):
+        results[key].merge(stats)
+        if progress is not None:
+            progress(key, results[key])
+    return results
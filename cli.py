@@ -0,0 +1,345 @@
+import argparse
+import os
+import sys
+
+# Subcommands import their engines lazily so a scalar call never loads
+# tkinter, matplotlib or NumPy
+
+
+def _int_list(text):
+    try:
+        return [int(token) for token in text.split(",") if token.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer list: {text!r}")
+
+
+class _IntListAction(argparse.Action):
+    # "-m 7 8 9" and "-m 7,8,9" give the same list. nargs="+" also swallows
+    # an input file written right after the list, so commands that take one
+    # get it back here.
+    def __call__(self, parser, namespace, values, option_string=None):
+        if hasattr(namespace, "input") and len(values) > 1:
+            try:
+                _int_list(values[-1])
+            except argparse.ArgumentTypeError:
+                *values, namespace.input = values
+        try:
+            setattr(namespace, self.dest, [value for text in values for value in _int_list(text)])
+        except argparse.ArgumentTypeError as e:
+            raise argparse.ArgumentError(self, str(e))
+
+
+def _open_input(path):
+    if path is None or path == "-":
+        return sys.stdin
+    return open(path)
+
+
+def _read_rows(path):
+    stream = _open_input(path)
+    try:
+        for line in stream:
+            line = line.split("#", 1)[0].replace(",", " ").strip()
+            if line:
+                yield [int(token) for token in line.split()]
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def _write_rows(rows):
+    write = sys.stdout.write
+    for row in rows:
+        write(" ".join(str(int(value)) for value in row))
+        write("\n")
+
+
+def _cmd_convert(args):
+    rows = _read_rows(args.input)
+    if args.reverse:
+        if args.batch:
+            from reverse_conversion import batch_reverse_conversion
+            rows = list(rows)
+            if rows:
+                _write_rows([value] for value in batch_reverse_conversion(rows, args.moduli, args.method))
+            return 0
+        from reverse_conversion import reverse_conversion
+        from moduli import as_moduli_set
+        basis = as_moduli_set(args.moduli)
+        _write_rows([reverse_conversion(row, basis, args.method)] for row in rows)
+        return 0
+
+    values = [value for row in rows for value in row]
+    if args.batch:
+        from rns_batch import batch_forward_conversion
+        if values:
+            _write_rows(batch_forward_conversion(values, args.moduli))
+        return 0
+    from moduli import as_moduli_set
+    from rns import forward_conversion
+    basis = as_moduli_set(args.moduli)
+    _write_rows(forward_conversion(value, basis) for value in values)
+    return 0
+
+
+_ARITHMETIC = {
+    "add": ("modular_addition", "batch_modular_addition"),
+    "sub": ("modular_subtraction", "batch_modular_subtraction"),
+    "mul": ("modular_multiplication", "batch_modular_multiplication"),
+    "div": ("modular_division", "batch_modular_division"),
+}
+
+
+def _cmd_arith(args):
+    from moduli import as_moduli_set
+    basis = as_moduli_set(args.moduli) if args.decode or args.op == "div" else args.moduli
+    pairs = []
+    for row in _read_rows(args.input):
+        if len(row) != 2:
+            raise ValueError("Each line must hold two operands: X Y")
+        pairs.append(row)
+
+    scalar_name, batch_name = _ARITHMETIC[args.op]
+    if args.batch:
+        import rns_batch
+        if not pairs:
+            return 0
+        X = rns_batch.batch_forward_conversion([x for x, _ in pairs], basis)
+        Y = rns_batch.batch_forward_conversion([y for _, y in pairs], basis)
+        results = getattr(rns_batch, batch_name)(X, Y, basis)
+        if args.decode:
+            from reverse_conversion import batch_reverse_conversion
+            results = ([value] for value in batch_reverse_conversion(results, basis))
+        _write_rows(results)
+        return 0
+
+    import rns
+    operation = getattr(rns, scalar_name)
+    results = (operation(rns.forward_conversion(x, basis), rns.forward_conversion(y, basis), basis)
+               for x, y in pairs)
+    if args.decode:
+        from reverse_conversion import crt_reverse_conversion
+        results = ([crt_reverse_conversion(result, basis)] for result in results)
+    _write_rows(results)
+    return 0
+
+
+def _cmd_rrns(args):
+    from rrns import RRNSCode
+    code = RRNSCode(args.info, args.redundant, args.engine)
+    if args.encode:
+        _write_rows(code.encode(value) for row in _read_rows(args.input) for value in row)
+        return 0
+    write = sys.stdout.write
+    for row in _read_rows(args.input):
+        result = code.decode(row)
+        value = "-" if result.value is None else result.value
+        errors = ",".join(map(str, result.error_indices)) or "-"
+        write(f"{result.status} {value} {errors}\n")
+    return 0
+
+
+def _cmd_campaign(args):
+    import json
+    from campaign import burst_errors, fixed_errors, pattern_label, run_campaign
+    if args.positions:
+        patterns = (fixed_errors(args.positions),)
+    elif args.pattern == "burst":
+        patterns = tuple(burst_errors(errors) for errors in args.errors)
+    else:
+        patterns = tuple(args.errors)
+    results = run_campaign([(args.info, args.redundant)], patterns, args.trials,
+                           workers=args.workers, seed=args.seed, engine=args.engine)
+    report = {pattern_label(errors): stats.to_dict() for (_, errors), stats in results.items()}
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+def _cmd_sticker(args):
+    import lab
+    from sticker import Tube
+    from sticker_program import parse_program
+
+    if args.realtime:
+        lab.set_cost_model(lab.LabCostModel(realtime=True))
+    with open(args.program) as f:
+        text = f.read()
+    stream = _open_input(args.input)
+    try:
+        strands = [line.strip() for line in stream if line.strip()]
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    tube = Tube.from_strings(strands)
+    outputs = parse_program(text, tube.length).run(tube)
+
+    write = sys.stdout.write
+    for name, result in outputs.items():
+        write(f"# {name} ({len(result)} strands)\n")
+        for strand in result.to_strings():
+            write(strand + "\n")
+    if args.ledger:
+        ledger = lab.get_cost_model().ledger
+        write(f"# simulated lab time {ledger.simulated_time:.3f} s, operations {ledger.operations}\n")
+    return 0
+
+
+def _cmd_stream(args):
+    import pipeline
+    if args.direction == "forward":
+        if not args.moduli:
+            raise ValueError("--moduli is required for forward streaming")
+        manifest = pipeline.stream_forward_conversion(args.source, args.destination, args.moduli, args.format,
+                                                      args.dtype, args.chunk_size)
+        sys.stderr.write(f"converted {manifest['count']} values into {args.destination}\n")
+    else:
+        count = pipeline.stream_reverse_conversion(args.source, args.destination, args.method, args.format,
+                                                   args.dtype, args.chunk_size)
+        sys.stderr.write(f"reconstructed {count} values into {args.destination}\n")
+    return 0
+
+
+def _cmd_plan(args):
+    import json
+    from planner import plan_constants, plan_moduli
+    dynamic_range = args.range if args.range is not None else 2 ** args.range_bits
+    plan = plan_moduli(dynamic_range, args.redundancy, args.word_bits, args.min_channels)
+    if args.constants:
+        json.dump(plan_constants(plan), sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        sys.stdout.write(" ".join(map(str, plan.info)) + "\n")
+        if plan.redundant:
+            sys.stdout.write(" ".join(map(str, plan.redundant)) + "\n")
+    return 0
+
+
+def _cmd_report(args):
+    import report
+    if args.load:
+        sweeps = report.load_sweeps(args.load)
+    else:
+        sweeps = [report.measure_channel_sweep(args.channels, args.repeat)]
+        if args.errors:
+            sweeps.append(report.measure_error_sweep(args.errors, args.info, args.redundant, args.repeat))
+    path = report.write_html_report(sweeps, args.directory)
+    sys.stderr.write(f"wrote {len(sweeps)} charts and {path}\n")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="rns", description="Headless RNS and sticker-model tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def int_list(command, *flags, **kwargs):
+        command.add_argument(*flags, nargs="+", action=_IntListAction, **kwargs)
+
+    def moduli_option(command):
+        int_list(command, "-m", "--moduli", required=True, help="RNS moduli set, e.g. 7,8,9 or 7 8 9")
+
+    def input_option(command):
+        # -i can go anywhere; the positional is left unset unless given
+        command.add_argument("-i", "--input", help="input file (default: stdin)")
+        command.add_argument("input", nargs="?", default=argparse.SUPPRESS, help="same as --input")
+
+    convert = commands.add_parser("convert", help="forward or reverse conversion, one value per line")
+    moduli_option(convert)
+    convert.add_argument("--reverse", action="store_true", help="read residue vectors and print integers")
+    convert.add_argument("--method", choices=("crt", "mrc"),
+                         help="default: closed form for {2^n-1, 2^n, 2^n+1}, else crt")
+    convert.add_argument("--batch", action="store_true", help="use the vectorized NumPy engine")
+    input_option(convert)
+    convert.set_defaults(handler=_cmd_convert)
+
+    arith = commands.add_parser("arith", help="modular arithmetic on 'X Y' operand lines")
+    arith.add_argument("op", choices=sorted(_ARITHMETIC))
+    moduli_option(arith)
+    arith.add_argument("--decode", action="store_true", help="print the result as an integer")
+    arith.add_argument("--batch", action="store_true", help="use the vectorized NumPy engine")
+    input_option(arith)
+    arith.set_defaults(handler=_cmd_arith)
+
+    def code_options(command):
+        int_list(command, "--info", required=True, help="information moduli")
+        int_list(command, "--redundant", required=True, help="redundant moduli")
+        command.add_argument("--engine", choices=("syndrome", "search"), default="syndrome")
+
+    rrns = commands.add_parser("rrns", help="redundant-residue error correction, one vector per line")
+    code_options(rrns)
+    rrns.add_argument("--encode", action="store_true", help="read integers and print codewords")
+    input_option(rrns)
+    rrns.set_defaults(handler=_cmd_rrns)
+
+    campaign = commands.add_parser("campaign", help="fault-injection campaign, prints JSON statistics")
+    code_options(campaign)
+    int_list(campaign, "--errors", default=[1, 2])
+    campaign.add_argument("--pattern", choices=("random", "burst"), default="random",
+                          help="corrupt random channels or a run of adjacent ones")
+    int_list(campaign, "--positions", help="always corrupt these channels")
+    campaign.add_argument("--trials", type=int, default=100_000)
+    campaign.add_argument("--workers", type=int, default=None)
+    campaign.add_argument("--seed", type=int, default=0)
+    campaign.set_defaults(handler=_cmd_campaign)
+
+    stream = commands.add_parser("stream", help="chunked conversion of large files to columnar residues and back")
+    stream.add_argument("direction", choices=("forward", "reverse"))
+    stream.add_argument("source", help="integer file (forward) or residue directory (reverse)")
+    stream.add_argument("destination", help="residue directory (forward) or output file (reverse)")
+    int_list(stream, "-m", "--moduli", help="RNS moduli set (forward only)")
+    stream.add_argument("--format", choices=("text", "binary"), default="text",
+                        help="format of the integer file")
+    stream.add_argument("--dtype", default="<i8", help="NumPy dtype of binary integer files")
+    stream.add_argument("--method", choices=("crt", "mrc"),
+                        help="default: closed form for {2^n-1, 2^n, 2^n+1}, else crt")
+    stream.add_argument("--chunk-size", type=int, default=1 << 20)
+    stream.set_defaults(handler=_cmd_stream)
+
+    plan = commands.add_parser("plan", help="choose a coprime moduli set for a dynamic range")
+    required = plan.add_mutually_exclusive_group(required=True)
+    required.add_argument("--range", type=int, help="smallest dynamic range to cover")
+    required.add_argument("--range-bits", type=int, help="cover 2**BITS")
+    plan.add_argument("--redundancy", type=int, default=0, help="number of redundant moduli")
+    plan.add_argument("--word-bits", type=int, default=16, help="largest modulus is 2**BITS")
+    plan.add_argument("--min-channels", type=int, default=2)
+    plan.add_argument("--constants", action="store_true", help="print the set and its constants as JSON")
+    plan.set_defaults(handler=_cmd_plan)
+
+    report = commands.add_parser("report", help="measure latency sweeps and write charts with an HTML report")
+    report.add_argument("directory", help="output directory")
+    int_list(report, "--channels", default=[2, 3, 4, 5, 6, 8, 10, 12, 16])
+    report.add_argument("--errors", type=int, nargs="*", default=[0, 1, 2, 3],
+                        help="injected error counts for the RRNS sweep (none to skip it)")
+    int_list(report, "--info", default=[7, 11, 13, 17], help="information moduli")
+    int_list(report, "--redundant", default=[19, 23, 29, 31], help="redundant moduli")
+    report.add_argument("--repeat", type=int, default=5, help="timing samples per point")
+    report.add_argument("--load", help="re-render a saved sweeps.json instead of measuring")
+    report.set_defaults(handler=_cmd_report)
+
+    sticker = commands.add_parser("sticker", help="run a sticker program over strands, one per line")
+    sticker.add_argument("program", help="sticker program file")
+    sticker.add_argument("--ledger", action="store_true", help="print simulated lab time")
+    sticker.add_argument("--realtime", action="store_true", help="wait out simulated lab time")
+    input_option(sticker)
+    sticker.set_defaults(handler=_cmd_sticker)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        status = args.handler(args)
+        sys.stdout.flush()
+        return status
+    except BrokenPipeError:
+        # The reader went away, e.g. output piped into head. Point stdout at
+        # devnull so the flush at exit doesn't raise again.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except (OSError, ValueError) as e:
+        parser.exit(1, f"{parser.prog}: error: {e}\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
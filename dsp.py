@@ -0,0 +1,139 @@
+import numpy as np
+
+from moduli import as_moduli_set
+
+# Residues are assumed reduced, so a channel product is at most (m - 1)**2.
+# Accumulators skip the `%` until one more product could overflow int64.
+INT64_MAX = np.iinfo(np.int64).max
+# float64 sums of integers are exact up to 2**53, which lets small channels
+# run their matrix products through BLAS
+FLOAT64_EXACT_LIMIT = 2 ** 53
+
+
+def channel_headroom(moduli):
+    # Products of two residues an int64 accumulator holding a reduced value
+    # can absorb per channel; object channels never overflow
+    basis = as_moduli_set(moduli)
+    if basis.row.dtype == object:
+        return np.full(len(basis), INT64_MAX, dtype=np.int64)
+    span = basis.row - 1
+    return np.maximum((INT64_MAX - span) // np.maximum(span * span, 1), 1)
+
+
+def _as_residues(residues, basis, ndim):
+    m = basis.row
+    residues = np.asarray(residues)
+    if residues.ndim != ndim or residues.shape[-1] != len(m):
+        raise ValueError(f"Residues must be a {ndim}-d array whose last axis holds the {len(m)} channels.")
+    if m.dtype == object:
+        return residues.astype(object)
+    if residues.dtype == object:
+        return (residues % m).astype(np.int64)
+    return residues.astype(np.int64, copy=False)
+
+
+class ResidueAccumulator:
+    # Running sum of residue products over a (rows x k) window. Each channel
+    # counts the products it has taken since its last reduction and is reduced
+    # only when the next one could overflow.
+    def __init__(self, moduli, rows):
+        self.basis = as_moduli_set(moduli)
+        self.m = self.basis.row
+        self.total = np.zeros((rows, len(self.m)), dtype=self.m.dtype)
+        self.headroom = channel_headroom(self.basis)
+        self.pending = np.zeros(len(self.m), dtype=np.int64)
+
+    def _make_room(self):
+        due = self.pending >= self.headroom
+        if due.any():
+            self.total[:, due] %= self.m[due]
+            self.pending[due] = 0
+
+    def multiply_accumulate(self, residues_X, residues_Y, start=0):
+        # total[start:start + len(X)] += X * Y, with Y broadcast over rows
+        self._make_room()
+        X = np.asarray(residues_X)
+        self.total[start:start + X.shape[0]] += X * np.asarray(residues_Y)
+        self.pending += 1
+
+    def result(self):
+        self.total %= self.m
+        self.pending[:] = 0
+        return self.total.copy()
+
+
+def rns_dot(residues_X, residues_Y, moduli):
+    # Sum over rows of X * Y: one residue vector
+    basis = as_moduli_set(moduli)
+    m = basis.row
+    X, Y = _as_residues(residues_X, basis, 2), _as_residues(residues_Y, basis, 2)
+    if X.shape != Y.shape:
+        raise ValueError("Residue matrices must have the same shape.")
+    if m.dtype == object:
+        return (X * Y).sum(axis=0) % m
+    # One chunk length serves every channel, so the narrowest headroom sets
+    # it; einsum sums the products without materialising them
+    chunk = int(channel_headroom(basis).min())
+    total = np.zeros(len(m), dtype=np.int64)
+    for s in range(0, X.shape[0], chunk):
+        total = (total + np.einsum("ij,ij->j", X[s:s + chunk], Y[s:s + chunk]) % m) % m
+    return total
+
+
+def _channel_matmul(a, b, modulus):
+    span = (modulus - 1) ** 2
+    inner = a.shape[1]
+    if span * inner <= FLOAT64_EXACT_LIMIT:
+        product = a.astype(np.float64) @ b.astype(np.float64)
+        return product.astype(np.int64) % modulus
+    float_chunk = FLOAT64_EXACT_LIMIT // span
+    if float_chunk:
+        a, b = a.astype(np.float64), b.astype(np.float64)
+        chunk = float_chunk
+    else:
+        chunk = (INT64_MAX - (modulus - 1)) // span
+    total = np.zeros((a.shape[0], b.shape[1]), dtype=np.int64)
+    for s in range(0, inner, chunk):
+        part = a[:, s:s + chunk] @ b[s:s + chunk]
+        total = (total + part.astype(np.int64) % modulus) % modulus
+    return total
+
+
+def rns_matmul(residues_A, residues_B, moduli):
+    # (r x p x k) @ (p x c x k) -> (r x c x k), one matrix product per channel
+    basis = as_moduli_set(moduli)
+    A, B = _as_residues(residues_A, basis, 3), _as_residues(residues_B, basis, 3)
+    if A.shape[1] != B.shape[0]:
+        raise ValueError(f"Inner dimensions do not match: {A.shape[1]} and {B.shape[0]}.")
+    result = np.empty((A.shape[0], B.shape[1], len(basis)), dtype=basis.row.dtype)
+    for j, modulus in enumerate(basis.moduli):
+        if basis.row.dtype == object:
+            result[:, :, j] = np.dot(A[:, :, j], B[:, :, j]) % modulus
+        else:
+            result[:, :, j] = _channel_matmul(A[:, :, j], B[:, :, j], modulus)
+    return result
+
+
+def _channel_fir(x, h, modulus, block):
+    # Taps are convolved in blocks short enough that no sum can overflow
+    n = x.shape[0]
+    y = np.zeros(n, dtype=np.int64)
+    for s in range(0, min(h.shape[0], n), block):
+        y[s:] = (y[s:] + np.convolve(x[:n - s], h[s:s + block])[:n - s] % modulus) % modulus
+    return y
+
+
+def rns_fir(residues_x, residues_taps, moduli):
+    # y[n] = sum_t h[t] * x[n - t] with zero initial state
+    basis = as_moduli_set(moduli)
+    x, taps = _as_residues(residues_x, basis, 2), _as_residues(residues_taps, basis, 2)
+    n = x.shape[0]
+    if basis.row.dtype == object:
+        accumulator = ResidueAccumulator(basis, n)
+        for t in range(min(taps.shape[0], n)):
+            accumulator.multiply_accumulate(x[:n - t], taps[t], start=t)
+        return accumulator.result()
+    result = np.empty_like(x)
+    for j, (modulus, block) in enumerate(zip(basis.moduli, channel_headroom(basis).tolist())):
+        result[:, j] = _channel_fir(x[:, j], taps[:, j], modulus, block)
+    return result
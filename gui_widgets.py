@@ -0,0 +1,164 @@
+import time
+import tkinter as tk
+from tkinter import ttk
+
+POLL_INTERVAL_MS = 50
+# Redrawing a Matplotlib canvas is far slower than the analyses produce points
+REDRAW_INTERVAL = 0.25
+MAX_ITEMS_PER_POLL = 5000
+
+
+class VirtualList(tk.Frame):
+    # Holds any number of rows but only ever gives the Listbox the visible slice
+    def __init__(self, master, rows=15, width=100):
+        super().__init__(master)
+        self.items = []
+        self.offset = 0
+        self.rows = rows
+        self.listbox = tk.Listbox(self, height=rows, width=width, activestyle="none")
+        self.scrollbar = tk.Scrollbar(self, orient="vertical", command=self._on_scroll)
+        self.listbox.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+        self.listbox.bind("<MouseWheel>", self._on_wheel)
+        self.listbox.bind("<Button-4>", lambda e: self._scroll_to(self.offset - 3))
+        self.listbox.bind("<Button-5>", lambda e: self._scroll_to(self.offset + 3))
+
+    def __len__(self):
+        return len(self.items)
+
+    def extend(self, rows):
+        following = self.offset + self.rows >= len(self.items)
+        self.items.extend(rows)
+        # Keep showing the newest rows unless the user scrolled away from them
+        self._scroll_to(len(self.items) - self.rows if following else self.offset)
+
+    def clear(self):
+        self.items = []
+        self._scroll_to(0)
+
+    def _scroll_to(self, offset):
+        self.offset = max(0, min(offset, len(self.items) - self.rows))
+        self.listbox.delete(0, tk.END)
+        for row in self.items[self.offset:self.offset + self.rows]:
+            self.listbox.insert(tk.END, row)
+        if self.items:
+            first = self.offset / len(self.items)
+            self.scrollbar.set(first, min(1.0, (self.offset + self.rows) / len(self.items)))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _on_scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            self._scroll_to(int(float(amount) * len(self.items)))
+        elif action == "scroll":
+            step = self.rows if unit == "pages" else 1
+            self._scroll_to(self.offset + int(amount) * step)
+
+    def _on_wheel(self, event):
+        self._scroll_to(self.offset - (1 if event.delta > 0 else -1) * 3)
+        return "break"
+
+
+class LivePlot(tk.Frame):
+    # A Matplotlib figure embedded in Tk whose redraws are rate limited
+    def __init__(self, master, title, xlabel, ylabel, figsize=(8, 3.5)):
+        super().__init__(master)
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+
+        self.labels = (title, xlabel, ylabel)
+        self.figure = Figure(figsize=figsize)
+        self.axes = self.figure.add_subplot()
+        self._decorate()
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True)
+        self.lines = {}
+        self.last_draw = 0.0
+
+    def _decorate(self):
+        title, xlabel, ylabel = self.labels
+        self.axes.set_title(title)
+        self.axes.set_xlabel(xlabel)
+        self.axes.set_ylabel(ylabel)
+
+    def add_line(self, name):
+        self.lines[name] = (self.axes.plot([], [], label=name)[0], [], [])
+        self.axes.legend()
+
+    def extend_line(self, name, xs, ys):
+        line, line_x, line_y = self.lines[name]
+        line_x.extend(xs)
+        line_y.extend(ys)
+        line.set_data(line_x, line_y)
+
+    def bars(self, labels, values, color="skyblue"):
+        self.axes.clear()
+        self._decorate()
+        self.axes.bar(labels, values, color=color, width=0.5)
+
+    def redraw(self, force=False):
+        now = time.monotonic()
+        if force or now - self.last_draw >= REDRAW_INTERVAL:
+            self.axes.relim()
+            self.axes.autoscale_view()
+            self.canvas.draw_idle()
+            self.last_draw = now
+
+
+class JobPanel(tk.Frame):
+    # Progress bar, status line and Cancel button driving a BackgroundJob
+    def __init__(self, master):
+        super().__init__(master)
+        self.progress = ttk.Progressbar(self, length=400, mode="determinate")
+        self.status = tk.Label(self, text="")
+        self.cancel_button = tk.Button(self, text="Cancel", command=self.cancel)
+        self.progress.pack(side="left", padx=5)
+        self.cancel_button.pack(side="left", padx=5)
+        self.status.pack(side="left", padx=5)
+        self.job = None
+
+    def run(self, job, total, on_items, on_done):
+        self.job = job
+        self.total = total
+        self.count = 0
+        self.on_items = on_items
+        self.on_done = on_done
+        self.progress.configure(maximum=max(total, 1), value=0)
+        self.status.configure(text="Running...")
+        self.cancel_button.configure(state="normal")
+        job.start()
+        self.after(POLL_INTERVAL_MS, self._poll)
+
+    def destroy(self):
+        # Clearing the output frame must not leave an orphaned analysis running
+        if self.job is not None:
+            self.job.cancel()
+        super().destroy()
+
+    def cancel(self):
+        if self.job is not None:
+            self.job.cancel()
+            self.status.configure(text="Cancelling...")
+
+    def _poll(self):
+        if not self.winfo_exists() or self.job is None:
+            return
+        finished = self.job.done
+        items = self.job.poll(MAX_ITEMS_PER_POLL)
+        if items:
+            self.count += len(items)
+            self.progress.configure(value=self.count)
+            self.status.configure(text=f"{self.count} / {self.total}")
+            self.on_items(items)
+        if finished and not items:
+            job, self.job = self.job, None
+            self.cancel_button.configure(state="disabled")
+            if job.error is not None:
+                self.status.configure(text=f"Failed: {job.error}")
+            elif job.cancelled.is_set():
+                self.status.configure(text=f"Cancelled after {self.count} / {self.total}")
+            else:
+                self.status.configure(text=f"Done: {self.count} / {self.total}")
+            self.on_done(job)
+            return
+        self.after(POLL_INTERVAL_MS, self._poll)
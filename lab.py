@@ -0,0 +1,72 @@
+import time
+
+# Simulated bench time per operation in seconds (the old time.sleep values)
+DEFAULT_OPERATION_COSTS = {
+    "combine": 0.01,
+    "separate": 0.02,
+    "set": 0.015,
+    "clear": 0.015,
+    "discard": 0.005,
+}
+
+
+class LabLedger:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.simulated_time = 0.0
+        self.operations = {}
+        self.strands = {}
+
+    def record(self, operation, cost, strands):
+        self.simulated_time += cost
+        self.operations[operation] = self.operations.get(operation, 0) + 1
+        self.strands[operation] = self.strands.get(operation, 0) + strands
+
+    def to_dict(self):
+        return {
+            "simulated_time": self.simulated_time,
+            "operations": dict(self.operations),
+            "strands": dict(self.strands),
+        }
+
+    def __repr__(self):
+        return f"LabLedger(simulated_time={self.simulated_time:.3f}s, operations={self.operations})"
+
+
+class LabCostModel:
+    # Subclass and override cost() for strand-dependent pricing
+    def __init__(self, costs=None, realtime=False, ledger=None):
+        self.costs = dict(DEFAULT_OPERATION_COSTS if costs is None else costs)
+        self.realtime = realtime
+        self.ledger = LabLedger() if ledger is None else ledger
+
+    def cost(self, operation, strands):
+        return self.costs.get(operation, 0.0)
+
+    def charge(self, operation, strands=0):
+        cost = self.cost(operation, strands)
+        self.ledger.record(operation, cost, strands)
+        if self.realtime and cost > 0:
+            # Demo mode: actually wait as long as the bench would
+            time.sleep(cost)
+        return cost
+
+
+_cost_model = LabCostModel()
+
+
+def get_cost_model():
+    return _cost_model
+
+
+def set_cost_model(model):
+    global _cost_model
+    previous = _cost_model
+    _cost_model = model
+    return previous
+
+
+def charge(operation, strands=0):
+    return _cost_model.charge(operation, strands)
@@ -1,161 +1,38 @@
-import tkinter as tk
-from tkinter import messagebox
-import matplotlib.pyplot as plt
 import random
-import time
-
-# Fonksiyonlar
-def forward_conversion(X, moduli):
-    return [X % m for m in moduli]
-
-def modular_addition(residues_X, residues_Y, moduli):
-    return [(residues_X[i] + residues_Y[i]) % moduli[i] for i in range(len(moduli))]
-
-def modular_subtraction(residues_X, residues_Y, moduli):
-    return [(residues_X[i] - residues_Y[i]) % moduli[i] for i in range(len(moduli))]
-
-def modular_multiplication(residues_X, residues_Y, moduli):
-    return [(residues_X[i] * residues_Y[i]) % moduli[i] for i in range(len(moduli))]
-
-def modular_division(residues_X, residues_Y, moduli):
-    result = []
-    for i in range(len(moduli)):
-        if residues_Y[i] == 0:
-            raise ValueError(f"Division by zero in residue index {i}.")
-        result.append((residues_X[i] * pow(residues_Y[i], -1, moduli[i])) % moduli[i])
-    return result
-
-def introduce_error(residues, error_index):
-    erroneous_residues = residues.copy()
-    erroneous_residues[error_index] += 1
-    return erroneous_residues
-
-def introduce_double_error(residues, error_indices):
-    erroneous_residues = residues.copy()
-    for idx in error_indices:
-        erroneous_residues[idx] += 1
-    return erroneous_residues
-
-def detect_error_with_math(original_residues, erroneous_residues, moduli):
-    for i in range(len(moduli)):
-        if original_residues[i] != erroneous_residues[i]:
-            return i
-    return -1
-
-def detect_and_correct_double_error(original_residues, erroneous_residues, moduli):
-    detected_indices = []
-    corrected_residues = erroneous_residues.copy()
-    for i in range(len(moduli)):
-        if original_residues[i] != erroneous_residues[i]:
-            detected_indices.append(i)
-            corrected_residues[i] = original_residues[i]
-    return detected_indices, corrected_residues
-
-def analyze_performance(repeat_count, moduli, X):
-    single_error_times = []
-    double_error_times = []
-    for _ in range(repeat_count):
-        original_residues = forward_conversion(X, moduli)
-
-        # Single Error
-        single_error_index = random.randint(0, len(moduli) - 1)
-        erroneous_residues = introduce_error(original_residues, single_error_index)
-        start_time = time.time()
-        detect_error_with_math(original_residues, erroneous_residues, moduli)
-        single_error_times.append(time.time() - start_time)
-
-        # Double Error
-        double_error_indices = random.sample(range(len(moduli)), 2)
-        erroneous_residues = introduce_double_error(original_residues, double_error_indices)
-        start_time = time.time()
-        detect_and_correct_double_error(original_residues, erroneous_residues, moduli)
-        double_error_times.append(time.time() - start_time)
-
-    return single_error_times, double_error_times
-
-def analyze_sticker_model(dna_set, bit_position):
-    operations = ["Combine", "Separate", "Set", "Discard"]
-    times = []
-
-    for operation in operations:
-        start_time = time.time()
-        if operation == "Combine":
-            combine(dna_set)
-        elif operation == "Separate":
-            separate(dna_set, bit_position)
-        elif operation == "Set":
-            set_bit(dna_set, bit_position)
-        elif operation == "Discard":
-            discard(dna_set)
-        elapsed_time = time.time() - start_time
-        times.append(elapsed_time)
-
-    # Grafik çizimi
-    plt.figure(figsize=(10, 6))
-    scaled_times = [t * 1000 for t in times]  # Milisaniyeye çevir
-    plt.bar(operations, scaled_times, color='skyblue', width=0.5)
-    plt.xlabel("Operations", fontsize=12)
-    plt.ylabel("Time (milliseconds)", fontsize=12)
-    plt.title("Performance Analysis of Sticker Model Operations", fontsize=14)
-    plt.xticks(fontsize=10)
-    plt.yticks(fontsize=10)
-    plt.tight_layout()
-    #plt.show()
-    plt.savefig("output.png")  # Grafiği 'output.png' dosyasına kaydet
-    return operations, times
-
-# DNA Sticker Model Fonksiyonları
-def combine(dna_set):
-    time.sleep(0.01)  # Simülasyon için bekleme
-    return "".join(dna_set)
-
-def separate(dna_strand, bit_position):
-    time.sleep(0.02)  # Simülasyon için bekleme
-    on = []
-    off = []
-    for strand in dna_strand:
-        if strand[bit_position] == "1":
-            on.append(strand)
-        else:
-            off.append(strand)
-    return on, off
-
-def set_bit(dna_strand, bit_position):
-    time.sleep(0.015)  # Simülasyon için bekleme
-    modified_strands = []
-    for strand in dna_strand:
-        strand = strand[:bit_position] + "1" + strand[bit_position + 1:]
-        modified_strands.append(strand)
-    return modified_strands
-
-def discard(dna_strand):
-    time.sleep(0.005)  # Simülasyon için bekleme
-    return []
-
-# Performance Analysis Function
-def analyze_sticker_performance(dna_set, bit_position):
-    operations = ["Combine", "Separate", "Set", "Discard"]
-    times = []
-    results = []
-
-    for operation in operations:
-        start_time = time.time()
-        if operation == "Combine":
-            result = combine(dna_set)
-        elif operation == "Separate":
-            result = separate(dna_set, bit_position)
-        elif operation == "Set":
-            result = set_bit(dna_set, bit_position)
-        elif operation == "Discard":
-            result = discard(dna_set)
-        elapsed_time = time.time() - start_time
-        times.append(elapsed_time)
-        results.append(result)
-
-    return operations, times, results
+
+from rns import (
+    forward_conversion,
+    modular_addition,
+    modular_subtraction,
+    modular_multiplication,
+    modular_division,
+    introduce_error,
+    introduce_double_error,
+    detect_error_with_math,
+    detect_and_correct_double_error,
+    analyze_performance,
+    iter_performance,
+)
+from sticker_strings import (
+    analyze_sticker_model,
+    combine,
+    separate,
+    set_bit,
+    discard,
+    analyze_sticker_performance,
+    iter_sticker_performance,
+)
+from lab import get_cost_model
+from workers import BackgroundJob
 
 # Ana UI
 def main_ui():
+    # GUI ve grafik modülleri yalnızca arayüz açılınca yüklenir
+    import tkinter as tk
+    from tkinter import messagebox
+    from gui_widgets import JobPanel, LivePlot, VirtualList
+    from report import Sweep, render_sweep
+
     root = tk.Tk()
     root.title("RNS Modular Operations and Sticker Model")
     root.geometry("1000x900")
@@ -405,41 +282,87 @@ def main_ui():
             tk.Button(input_frame, text="Run Detection", command=run_double_error_detection).grid(row=2, column=0, columnspan=2, pady=10)
 
         elif selected == "Analysis":
-            tk.Label(input_frame, text="Enter a number (X):").grid(row=0, column=0, padx=10, pady=5)
-            x_entry = tk.Entry(input_frame)
-            x_entry.grid(row=0, column=1, padx=10, pady=5)
+            tk.Label(input_frame, text="Information Moduli:").grid(row=0, column=0, padx=10, pady=5)
+            info_entry = tk.Entry(input_frame)
+            info_entry.grid(row=0, column=1, padx=10, pady=5)
 
-            tk.Label(input_frame, text="Enter RNS Moduli Set:").grid(row=1, column=0, padx=10, pady=5)
-            moduli_entry = tk.Entry(input_frame)
-            moduli_entry.grid(row=1, column=1, padx=10, pady=5)
+            tk.Label(input_frame, text="Redundant Moduli:").grid(row=1, column=0, padx=10, pady=5)
+            redundant_entry = tk.Entry(input_frame)
+            redundant_entry.grid(row=1, column=1, padx=10, pady=5)
 
-            tk.Label(input_frame, text="Enter Number of Repeats:").grid(row=2, column=0, padx=10, pady=5)
-            repeat_entry = tk.Entry(input_frame)
-            repeat_entry.grid(row=2, column=1, padx=10, pady=5)
+            tk.Label(input_frame, text="Error Counts:").grid(row=2, column=0, padx=10, pady=5)
+            errors_entry = tk.Entry(input_frame)
+            errors_entry.insert(0, "1 2")
+            errors_entry.grid(row=2, column=1, padx=10, pady=5)
 
-            def run_analysis():
-                clear_output_frame()
-                try:
-                    X = int(x_entry.get())
-                    moduli = list(map(int, moduli_entry.get().split()))
-                    repeat_count = int(repeat_entry.get())
+            tk.Label(input_frame, text="Error Pattern:").grid(row=3, column=0, padx=10, pady=5)
+            pattern_var = tk.StringVar(value="random")
+            tk.OptionMenu(input_frame, pattern_var, "random", "burst").grid(row=3, column=1, padx=10, pady=5)
 
-                    single_error_times, double_error_times = analyze_performance(repeat_count, moduli, X)
+            tk.Label(input_frame, text="Trials per Error Count:").grid(row=4, column=0, padx=10, pady=5)
+            trials_entry = tk.Entry(input_frame)
+            trials_entry.insert(0, "100000")
+            trials_entry.grid(row=4, column=1, padx=10, pady=5)
 
-                    plt.figure(figsize=(10, 6))
-                    plt.plot(range(repeat_count), single_error_times, label="Single Error Detection Time")
-                    plt.plot(range(repeat_count), double_error_times, label="Double Error Detection Time")
-                    plt.xlabel("Iteration")
-                    plt.ylabel("Time (s)")
-                    plt.title("Performance Analysis of Error Detection")
-                    plt.legend()
-                    #plt.show()
-                    plt.savefig("output.png")  # Grafiği 'output.png' adıyla kaydeder
+            def run_analysis():
+                # Hata enjeksiyonu kampanyası arka planda, çok çekirdekte çalışır
+                from campaign import (
+                    CampaignStats,
+                    burst_errors,
+                    campaign_shard_count,
+                    iter_campaign,
+                    pattern_label,
+                )
 
+                clear_output_frame()
+                try:
+                    info = list(map(int, info_entry.get().split()))
+                    redundant = list(map(int, redundant_entry.get().split()))
+                    counts = list(map(int, errors_entry.get().split()))
+                    trials = int(trials_entry.get())
+                    if not info or not redundant or not counts or trials < 1:
+                        raise ValueError
                 except ValueError:
                     messagebox.showerror("Input Error", "Please enter valid inputs!")
-
-            tk.Button(input_frame, text="Run Analysis", command=run_analysis).grid(row=3, column=0, columnspan=2, pady=10)
+                    return
+                patterns = [burst_errors(c) for c in counts] if pattern_var.get() == "burst" else counts
+                codes = [(info, redundant)]
+                labels = [pattern_label(p) for p in patterns]
+                totals = {p: CampaignStats() for p in patterns}
+
+                panel = JobPanel(output_frame)
+                panel.pack(pady=5)
+                plot = LivePlot(output_frame, "Fault-Injection Campaign", "Injected errors", "Correction rate")
+                plot.pack(pady=5)
+                rows = VirtualList(output_frame, rows=8)
+                rows.pack(pady=5)
+
+                def show_items(items):
+                    for (_, errors), stats in items:
+                        totals[errors].merge(stats)
+                        total = totals[errors]
+                        rows.extend([f"Errors {pattern_label(errors)}: {total.trials} trials, "
+                                     f"detection {total.detection_rate:.4f}, correction {total.correction_rate:.4f}, "
+                                     f"miscorrection {total.miscorrection_rate:.4f}, "
+                                     f"mean latency {total.mean_latency_ns / 1e3:.2f} us"])
+                    plot.bars(labels, [totals[p].correction_rate for p in patterns])
+                    plot.redraw()
+
+                def finish(job):
+                    plot.redraw(force=True)
+                    if job.error is not None:
+                        messagebox.showerror("Analysis Error", str(job.error))
+                        return
+                    sweep = Sweep("fault_injection", "Fault-Injection Campaign", "Injected errors", "Rate", "bar",
+                                  labels, {"Detection rate": [totals[p].detection_rate for p in patterns],
+                                           "Correction rate": [totals[p].correction_rate for p in patterns],
+                                           "Miscorrection rate": [totals[p].miscorrection_rate for p in patterns]})
+                    render_sweep(sweep, "output.png")  # Grafiği 'output.png' adıyla kaydeder
+
+                job = BackgroundJob(lambda: iter_campaign(codes, patterns, trials))
+                panel.run(job, campaign_shard_count(codes, patterns, trials), show_items, finish)
+
+            tk.Button(input_frame, text="Run Analysis", command=run_analysis).grid(row=5, column=0, columnspan=2, pady=10)
             
         elif selected == "Sticker Model Analysis":
             tk.Label(input_frame, text="Enter DNA Strands (comma-separated):").grid(row=0, column=0, padx=10, pady=10)
@@ -461,31 +384,52 @@ def main_ui():
                         raise ValueError("DNA strands cannot be empty.")
                     if any(len(strand) <= bit_position for strand in dna_set):
                         raise ValueError("Bit position is out of range for the given DNA strands.")
-
-                    operations, times, results = analyze_sticker_performance(dna_set, bit_position)
-
-                    tk.Label(output_frame, text=f"Input DNA Strands: {dna_set}").pack(pady=5)
-                    tk.Label(output_frame, text=f"Bit Position: {bit_position}").pack(pady=5)
-
-                    for i, operation in enumerate(operations):
-                        tk.Label(output_frame, text=f"{operation} Result: {results[i]}").pack(pady=5)
-                        tk.Label(output_frame, text=f"{operation} Time: {times[i] * 1000:.2f} ms").pack(pady=5)
-
-                    # Grafik çizimi
-                    plt.figure(figsize=(10, 6))
-                    scaled_times = [t * 1000 for t in times]  # Milisaniyeye çevir
-                    plt.bar(operations, scaled_times, color='skyblue', width=0.5)
-                    plt.xlabel("Operations", fontsize=12)
-                    plt.ylabel("Time (milliseconds)", fontsize=12)
-                    plt.title("Performance Analysis of Sticker Model Operations", fontsize=14)
-                    plt.xticks(fontsize=10)
-                    plt.yticks(fontsize=10)
-                    plt.tight_layout()
-                    #plt.show()
-                    plt.savefig("output.png")  # Grafiği 'output.png' adıyla kaydeder
-
                 except ValueError as e:
                     messagebox.showerror("Input Error", str(e))
+                    return
+
+                ledger = get_cost_model().ledger
+                ledger.reset()
+                tk.Label(output_frame, text=f"Input DNA Strands: {len(dna_set)}, Bit Position: {bit_position}").pack(pady=5)
+                panel = JobPanel(output_frame)
+                panel.pack(pady=5)
+                lab_time = tk.Label(output_frame, text="Simulated Lab Time: 0.00 ms")
+                lab_time.pack(pady=5)
+                plot = LivePlot(output_frame, "Performance Analysis of Sticker Model Operations", "Operations",
+                                "Time (milliseconds)")
+                plot.pack(pady=5)
+                rows = VirtualList(output_frame, rows=10)
+                rows.pack(pady=5)
+                operations, scaled_times = [], []
+
+                def show_items(items):
+                    for operation, elapsed, result in items:
+                        operations.append(operation)
+                        scaled_times.append(elapsed * 1000)  # Milisaniyeye çevir
+                        rows.extend([f"{operation} Time: {elapsed * 1000:.2f} ms"])
+                        # Büyük sonuçlar satır satır listelenir
+                        if isinstance(result, tuple):
+                            for name, part in zip(("on", "off"), result):
+                                rows.extend(f"{operation} Result ({name}): {strand}" for strand in part)
+                        elif isinstance(result, list):
+                            rows.extend(f"{operation} Result: {strand}" for strand in result)
+                        else:
+                            rows.extend([f"{operation} Result: {result}"])
+                    lab_time.configure(text=f"Simulated Lab Time: {ledger.simulated_time * 1000:.2f} ms")
+                    plot.bars(operations, scaled_times)
+                    plot.redraw()
+
+                def finish(job):
+                    plot.redraw(force=True)
+                    if job.error is not None:
+                        messagebox.showerror("Analysis Error", str(job.error))
+                        return
+                    sweep = Sweep("sticker_operations", "Performance Analysis of Sticker Model Operations",
+                                  "Operations", "Time (milliseconds)", "bar", operations, {"Time": scaled_times})
+                    render_sweep(sweep, "output.png")  # Grafiği 'output.png' adıyla kaydeder
+
+                job = BackgroundJob(lambda: iter_sticker_performance(dna_set, bit_position))
+                panel.run(job, 4, show_items, finish)
 
             tk.Button(input_frame, text="Run Analysis", command=run_sticker_analysis).grid(row=2, column=0, columnspan=2, pady=20)
 
@@ -0,0 +1,121 @@
+import math
+from functools import cached_property, lru_cache
+
+from special_forms import triple_exponent
+
+# Moduli up to this size get a full inverse lookup table
+SMALL_MODULUS_LIMIT = 2 ** 12
+# Channel products must stay below 2**63 to use int64 residues
+INT64_MODULUS_LIMIT = 2 ** 31
+
+
+class ModuliSet:
+    def __init__(self, moduli, inverse_tables=True):
+        moduli = tuple(int(m) for m in moduli)
+        if not moduli:
+            raise ValueError("Moduli set cannot be empty.")
+        if any(m < 2 for m in moduli):
+            raise ValueError("All moduli must be greater than 1.")
+        for i in range(len(moduli)):
+            for j in range(i + 1, len(moduli)):
+                if math.gcd(moduli[i], moduli[j]) != 1:
+                    raise ValueError(f"Moduli {moduli[i]} and {moduli[j]} are not coprime.")
+
+        self.moduli = moduli
+        self.dynamic_range = math.prod(moduli)
+        self.weights = tuple(self.dynamic_range // m for m in moduli)
+        self.crt_inverses = tuple(pow(w % m, -1, m) for w, m in zip(self.weights, moduli))
+        # Mixed-radix constants: radix_weights[i] = m_0 * ... * m_(i-1) and
+        # mrc_inverses[j][i] = m_j^-1 mod m_i for j < i
+        self.radix_weights = tuple(math.prod(moduli[:i]) for i in range(len(moduli)))
+        self.mrc_inverses = tuple(
+            tuple(pow(moduli[j], -1, moduli[i]) if i > j else 0 for i in range(len(moduli)))
+            for j in range(len(moduli))
+        )
+        self.inverse_tables = tuple(
+            _inverse_table(m) if inverse_tables and m <= SMALL_MODULUS_LIMIT else None for m in moduli
+        )
+
+    # Matched once so scalar operations never re-check for {2^n - 1, 2^n, 2^n + 1}
+    @cached_property
+    def special_triple(self):
+        return triple_exponent(self.moduli)
+
+    # NumPy views of the constants are built on first use so scalar
+    # callers never pay for importing NumPy
+    @cached_property
+    def row(self):
+        import numpy as np
+        return np.array(self.moduli, dtype=np.int64 if max(self.moduli) <= INT64_MODULUS_LIMIT else object)
+
+    @cached_property
+    def crt_inverse_row(self):
+        import numpy as np
+        return np.array(self.crt_inverses, dtype=self.row.dtype)
+
+    @cached_property
+    def mrc_inverse_matrix(self):
+        import numpy as np
+        return np.array(self.mrc_inverses, dtype=self.row.dtype)
+
+    @cached_property
+    def flat_inverse_table(self):
+        import numpy as np
+        if any(table is None for table in self.inverse_tables):
+            return None
+        return np.concatenate([np.array(table, dtype=np.int64) for table in self.inverse_tables])
+
+    @cached_property
+    def table_offsets(self):
+        import numpy as np
+        return np.cumsum((0,) + self.moduli[:-1]).astype(np.int64)
+
+    def inverse(self, index, value):
+        m = self.moduli[index]
+        table = self.inverse_tables[index]
+        if table is None:
+            return pow(value, -1, m)
+        inverse = table[value % m]
+        if inverse == 0:
+            raise ValueError(f"Residue {value} is not invertible modulo {m}.")
+        return inverse
+
+    def __len__(self):
+        return len(self.moduli)
+
+    def __iter__(self):
+        return iter(self.moduli)
+
+    def __getitem__(self, index):
+        return self.moduli[index]
+
+    def __eq__(self, other):
+        if isinstance(other, ModuliSet):
+            return self.moduli == other.moduli
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.moduli)
+
+    def __repr__(self):
+        return f"ModuliSet({list(self.moduli)})"
+
+
+def _inverse_table(m):
+    # 0 marks residues without an inverse
+    table = [0] * m
+    for y in range(1, m):
+        if math.gcd(y, m) == 1:
+            table[y] = pow(y, -1, m)
+    return table
+
+
+@lru_cache(maxsize=128)
+def _cached_moduli_set(moduli):
+    return ModuliSet(moduli)
+
+
+def as_moduli_set(moduli):
+    if isinstance(moduli, ModuliSet):
+        return moduli
+    return _cached_moduli_set(tuple(int(m) for m in moduli))
@@ -0,0 +1,154 @@
+import math
+from functools import lru_cache
+
+import numpy as np
+
+from bigint import primes_below
+
+# Base-extension sums are float64 matrix products: each term is below
+# 2**(2 * CHANNEL_BITS), so sums of up to 2**11 terms stay exact
+CHANNEL_BITS = 21
+MAX_CHANNELS = 1 << (53 - 2 * CHANNEL_BITS)
+WINDOW_BITS = 4
+
+
+class RNSMontgomery:
+    # Montgomery multiplication in RNS for one odd modulus N.
+    # Values live in two bases at once: B (Montgomery radix M = prod B) and
+    # C = B' plus one redundant channel m_r used for exact base extension.
+    def __init__(self, modulus):
+        N = int(modulus)
+        if N < 3 or N % 2 == 0:
+            raise ValueError("Montgomery modulus must be an odd integer greater than 2.")
+        self.modulus = N
+
+        # Smallest k with M >= (k+2)^2 N and M' > (k+2) N, so products of
+        # values below (k+2) N reduce back below (k+2) N
+        # Only B needs N invertible, so primes dividing N are left to B'
+        k = max(1, N.bit_length() // CHANNEL_BITS)
+        while True:
+            if k > MAX_CHANNELS:
+                raise ValueError(f"Modulus needs {k} channels; the exact base extension supports {MAX_CHANNELS}.")
+            count = 2 * k + 1
+            while True:
+                primes = primes_below(1 << CHANNEL_BITS, count)
+                B = [p for p in primes if N % p][:k]
+                if len(B) == k:
+                    break
+                count += 1
+            rest = [p for p in primes if p not in B]
+            B_prime = rest[:k]
+            M, M_prime = math.prod(B), math.prod(B_prime)
+            if M >= (k + 2) ** 2 * N and M_prime > (k + 2) * N:
+                break
+            k += 1
+        redundant = rest[k]
+        C = B_prime + [redundant]
+        self.channels = k
+        self.base = tuple(B)
+        self.extended_base = tuple(C)
+        self.radix = M
+        self.radix_inverse = pow(M, -1, N)
+
+        def row(values, moduli):
+            return np.array([v % m for v, m in zip(values, moduli)], dtype=np.int64)
+
+        self.B = np.array(B, dtype=np.int64)
+        self.C = np.array(C, dtype=np.int64)
+        self.neg_n_inverse_B = row([pow(-N, -1, m) for m in B], B)
+        self.n_C = row([N] * len(C), C)
+        self.radix_inverse_C = row([pow(M, -1, c) for c in C], C)
+        # B -> C extension without correction: q_hat = sum(xi_i * M_i) = q + alpha * M
+        weights_B = [M // m for m in B]
+        self.weight_inverse_B = row([pow(w, -1, m) for w, m in zip(weights_B, B)], B)
+        self.extend_B_to_C = np.array([[w % c for c in C] for w in weights_B], dtype=np.float64)
+        # B' -> B exact extension, the overflow beta is read off the redundant channel
+        weights_C = [M_prime // m for m in B_prime]
+        self.weights_C = weights_C
+        self.extended_radix = M_prime
+        self.weight_inverse_C = row([pow(w, -1, m) for w, m in zip(weights_C, B_prime)], B_prime)
+        self.extend_C_to_B = np.array([[w % m for m in B] + [w % redundant] for w in weights_C], dtype=np.float64)
+        self.extended_radix_B = row([M_prime] * k, B)
+        self.extended_radix_inverse_r = pow(M_prime, -1, redundant)
+        self.redundant = redundant
+
+    def __repr__(self):
+        return f"RNSMontgomery(bits={self.modulus.bit_length()}, channels={self.channels})"
+
+    def _residues(self, values, moduli):
+        return np.array([[v % m for m in moduli] for v in values], dtype=np.int64)
+
+    def to_montgomery(self, values):
+        # Integers -> (xB, xC) residue matrices of x * M mod N
+        values = [int(v) * self.radix % self.modulus for v in values]
+        return self._residues(values, self.base), self._residues(values, self.extended_base)
+
+    def from_montgomery(self, state):
+        _, xC = state
+        k = self.channels
+        B_prime = self.C[:k]
+        xi = xC[:, :k] * self.weight_inverse_C % B_prime
+        results = []
+        for row in xi.tolist():
+            value = sum(x * w for x, w in zip(row, self.weights_C)) % self.extended_radix
+            results.append(value * self.radix_inverse % self.modulus)
+        return results
+
+    def multiply(self, x, y):
+        # Montgomery product x * y * M^-1 mod N for values below (k+2) N;
+        # the result is below (k+2) N but not fully reduced
+        xB, xC = x
+        yB, yC = y
+        B, C, k = self.B, self.C, self.channels
+        sB = xB * yB % B
+        sC = xC * yC % C
+        xi = sB * self.neg_n_inverse_B % B * self.weight_inverse_B % B
+        q = (xi.astype(np.float64) @ self.extend_B_to_C).astype(np.int64) % C
+        rC = (sC + q * self.n_C) % C * self.radix_inverse_C % C
+
+        xi = rC[:, :k] * self.weight_inverse_C % C[:k]
+        sums = (xi.astype(np.float64) @ self.extend_C_to_B).astype(np.int64)
+        beta = (sums[:, k] % self.redundant - rC[:, k]) * self.extended_radix_inverse_r % self.redundant
+        rB = (sums[:, :k] % B - beta[:, None] * self.extended_radix_B) % B
+        return rB, rC
+
+    def pow(self, bases, exponent):
+        # Fixed-window exponentiation with one exponent shared by every base
+        exponent = int(exponent)
+        if exponent < 0:
+            raise ValueError("Negative exponents are not supported.")
+        bases = list(bases)
+        one = self.to_montgomery([1] * len(bases))
+        if exponent == 0:
+            return self.from_montgomery(one)
+        table = [one, self.to_montgomery(bases)]
+        for _ in range(2, 1 << WINDOW_BITS):
+            table.append(self.multiply(table[-1], table[1]))
+
+        digits = []
+        while exponent:
+            digits.append(exponent & ((1 << WINDOW_BITS) - 1))
+            exponent >>= WINDOW_BITS
+        result = table[digits[-1]]
+        for digit in reversed(digits[:-1]):
+            for _ in range(WINDOW_BITS):
+                result = self.multiply(result, result)
+            if digit:
+                result = self.multiply(result, table[digit])
+        return self.from_montgomery(result)
+
+
+@lru_cache(maxsize=32)
+def montgomery_context(modulus):
+    return RNSMontgomery(modulus)
+
+
+def montgomery_pow(base, exponent, modulus):
+    return montgomery_context(int(modulus)).pow([base], exponent)[0]
+
+
+def batch_montgomery_pow(bases, exponent, modulus):
+    bases = list(bases)
+    if not bases:
+        return []
+    return montgomery_context(int(modulus)).pow(bases, exponent)
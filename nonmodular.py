@@ -0,0 +1,130 @@
+from functools import lru_cache
+
+import numpy as np
+
+from moduli import as_moduli_set
+from reverse_conversion import batch_mixed_radix_digits, mixed_radix_digits
+from rns_batch import as_residue_matrix
+
+# Mixed-radix digits order values without reconstructing them: the last digit
+# is the most significant, so comparison is lexicographic from the top.
+# Signed values use the usual split: x >= ceil(M / 2) stands for x - M.
+
+
+def _lexicographic(digits_X, digits_Y):
+    for dx, dy in zip(reversed(digits_X), reversed(digits_Y)):
+        if dx != dy:
+            return 1 if dx > dy else -1
+    return 0
+
+
+@lru_cache(maxsize=64)
+def _half_range_digits(basis):
+    half = (basis.dynamic_range + 1) // 2
+    return tuple(mixed_radix_digits([half % m for m in basis.moduli], basis))
+
+
+@lru_cache(maxsize=64)
+def _scaling_weights(basis, count):
+    # weights[i][j] = m_count * ... * m_(i-1) mod m_j, for digit i >= count
+    weights = []
+    for i in range(count, len(basis)):
+        product = 1
+        for m in basis.moduli[count:i]:
+            product *= m
+        weights.append(tuple(product % m for m in basis.moduli))
+    return tuple(weights)
+
+
+def _check_count(basis, count):
+    if not 0 <= count <= len(basis):
+        raise ValueError("Scaling count must be between 0 and the number of moduli.")
+
+
+def compare_magnitude(residues_X, residues_Y, moduli):
+    basis = as_moduli_set(moduli)
+    return _lexicographic(mixed_radix_digits(residues_X, basis), mixed_radix_digits(residues_Y, basis))
+
+
+def detect_sign(residues, moduli):
+    basis = as_moduli_set(moduli)
+    digits = mixed_radix_digits(residues, basis)
+    if not any(digits):
+        return 0
+    return -1 if _lexicographic(digits, _half_range_digits(basis)) >= 0 else 1
+
+
+def detect_addition_overflow(residues_X, residues_Y, moduli, signed=False):
+    basis = as_moduli_set(moduli)
+    total = [(x + y) % m for x, y, m in zip(residues_X, residues_Y, basis.moduli)]
+    if signed:
+        sign_X, sign_Y = detect_sign(residues_X, basis), detect_sign(residues_Y, basis)
+        sign_total = detect_sign(total, basis)
+        return sign_X == sign_Y != 0 and sign_total != sign_X
+    # Unsigned: the sum wrapped iff it came out below an operand
+    return compare_magnitude(total, residues_X, basis) < 0
+
+
+def scale_by_moduli(residues, moduli, count):
+    # floor(x / (m_0 * ... * m_(count-1))) in every channel; order the
+    # ModuliSet to choose which moduli form the divisor
+    basis = as_moduli_set(moduli)
+    _check_count(basis, count)
+    digits = mixed_radix_digits(residues, basis)
+    weights = _scaling_weights(basis, count)
+    return [sum(d * w[j] for d, w in zip(digits[count:], weights)) % m for j, m in enumerate(basis.moduli)]
+
+
+def _batch_lexicographic(digits_X, digits_Y):
+    difference = np.sign(digits_X - digits_Y).astype(np.int64)[:, ::-1]
+    # First non-zero from the most significant digit decides each row
+    first = np.argmax(difference != 0, axis=1)
+    return difference[np.arange(difference.shape[0]), first]
+
+
+def batch_compare_magnitude(residues_X, residues_Y, moduli):
+    basis = as_moduli_set(moduli)
+    residues_X, residues_Y = as_residue_matrix(residues_X, basis), as_residue_matrix(residues_Y, basis)
+    if residues_X.shape != residues_Y.shape:
+        raise ValueError("Residue matrices must have the same shape.")
+    return _batch_lexicographic(batch_mixed_radix_digits(residues_X, basis),
+                                batch_mixed_radix_digits(residues_Y, basis))
+
+
+def _batch_sign_of_digits(digits, basis):
+    half = np.array(_half_range_digits(basis), dtype=digits.dtype)
+    negative = _batch_lexicographic(digits, np.broadcast_to(half, digits.shape)) >= 0
+    zero = ~digits.any(axis=1)
+    return np.where(zero, 0, np.where(negative, -1, 1))
+
+
+def batch_detect_sign(residues, moduli):
+    basis = as_moduli_set(moduli)
+    return _batch_sign_of_digits(batch_mixed_radix_digits(residues, basis), basis)
+
+
+def batch_detect_addition_overflow(residues_X, residues_Y, moduli, signed=False):
+    basis = as_moduli_set(moduli)
+    residues_X, residues_Y = as_residue_matrix(residues_X, basis), as_residue_matrix(residues_Y, basis)
+    if residues_X.shape != residues_Y.shape:
+        raise ValueError("Residue matrices must have the same shape.")
+    total = (residues_X + residues_Y) % basis.row
+    digits_total = batch_mixed_radix_digits(total, basis)
+    digits_X = batch_mixed_radix_digits(residues_X, basis)
+    if signed:
+        sign_X = _batch_sign_of_digits(digits_X, basis)
+        sign_Y = batch_detect_sign(residues_Y, basis)
+        sign_total = _batch_sign_of_digits(digits_total, basis)
+        return (sign_X == sign_Y) & (sign_X != 0) & (sign_total != sign_X)
+    return _batch_lexicographic(digits_total, digits_X) < 0
+
+
+def batch_scale_by_moduli(residues, moduli, count):
+    basis = as_moduli_set(moduli)
+    _check_count(basis, count)
+    digits = batch_mixed_radix_digits(residues, basis)
+    m = basis.row
+    scaled = np.zeros_like(digits)
+    for i, w in enumerate(_scaling_weights(basis, count)):
+        scaled = (scaled + digits[:, count + i, None] * np.array(w, dtype=m.dtype)) % m
+    return scaled
@@ -0,0 +1,165 @@
+import json
+import os
+import re
+
+import numpy as np
+
+from moduli import as_moduli_set
+from reverse_conversion import batch_reverse_conversion
+from rns_batch import batch_forward_conversion
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+TEXT_BLOCK_SIZE = 1 << 20
+_TRAILING_TOKEN = re.compile(r"(.*[\s,]|)([^\s,]*)", re.S)
+MANIFEST_NAME = "manifest.json"
+FORMAT_VERSION = 1
+
+
+def residue_dtype(modulus):
+    for dtype in (np.uint8, np.uint16, np.uint32, np.uint64):
+        if modulus - 1 <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    raise ValueError(f"Modulus {modulus} does not fit a 64-bit residue column.")
+
+
+def _iter_text_values(f, block_size):
+    # Fixed-size reads, so even a file written on one line stays bounded.
+    # Only a token cut at the end of a block, or an open comment, carries over.
+    carry = ""
+    in_comment = False
+    while True:
+        block = f.read(block_size)
+        if not block:
+            break
+        text = carry + block
+        if not in_comment and "#" not in text:
+            text, carry = _TRAILING_TOKEN.match(text).groups()
+            yield from map(int, text.replace(",", " ").split())
+            continue
+        lines = text.split("\n")
+        carry = ""
+        for i, line in enumerate(lines):
+            last = i == len(lines) - 1
+            if in_comment:
+                # A comment runs to the end of the line it started on
+                in_comment = last
+                continue
+            if "#" in line:
+                line = line.split("#", 1)[0]
+                in_comment = last
+            elif last:
+                line, carry = _TRAILING_TOKEN.match(line).groups()
+            for token in line.replace(",", " ").split():
+                yield int(token)
+    if carry:
+        yield int(carry)
+
+
+def iter_text_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, block_size=TEXT_BLOCK_SIZE):
+    # Whitespace or comma separated integers, any number per line
+    chunk = []
+    with open(path) as f:
+        for value in _iter_text_values(f, block_size):
+            chunk.append(value)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def iter_binary_chunks(path, dtype="<i8", chunk_size=DEFAULT_CHUNK_SIZE):
+    # Memory-mapped, so only the pages of the current chunk are resident
+    if os.path.getsize(path) == 0:
+        return
+    values = np.memmap(path, dtype=np.dtype(dtype), mode="r")
+    for start in range(0, len(values), chunk_size):
+        yield values[start:start + chunk_size]
+
+
+def _column_name(index, modulus):
+    return f"residues_{index:03d}_m{modulus}.bin"
+
+
+def stream_forward_conversion(source, output_dir, moduli, input_format="text", dtype="<i8",
+                              chunk_size=DEFAULT_CHUNK_SIZE):
+    basis = as_moduli_set(moduli)
+    os.makedirs(output_dir, exist_ok=True)
+    columns = [(_column_name(i, m), residue_dtype(m)) for i, m in enumerate(basis.moduli)]
+    if input_format == "text":
+        chunks = iter_text_chunks(source, chunk_size)
+    elif input_format == "binary":
+        chunks = iter_binary_chunks(source, dtype, chunk_size)
+    else:
+        raise ValueError(f"Unknown input format: {input_format}")
+
+    count = 0
+    files = [open(os.path.join(output_dir, name), "wb") for name, _ in columns]
+    try:
+        for chunk in chunks:
+            residues = batch_forward_conversion(chunk, basis)
+            for i, (f, (_, column_dtype)) in enumerate(zip(files, columns)):
+                residues[:, i].astype(column_dtype).tofile(f)
+            count += residues.shape[0]
+    finally:
+        for f in files:
+            f.close()
+
+    manifest = {
+        "version": FORMAT_VERSION,
+        "count": count,
+        "moduli": list(basis.moduli),
+        "columns": [{"file": name, "dtype": column_dtype.str} for name, column_dtype in columns],
+    }
+    with open(os.path.join(output_dir, MANIFEST_NAME), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def load_manifest(residue_dir):
+    with open(os.path.join(residue_dir, MANIFEST_NAME)) as f:
+        manifest = json.load(f)
+    if manifest.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported residue format version: {manifest.get('version')}")
+    return manifest
+
+
+def open_residue_columns(residue_dir):
+    manifest = load_manifest(residue_dir)
+    columns = []
+    for column in manifest["columns"]:
+        path = os.path.join(residue_dir, column["file"])
+        if manifest["count"] == 0:
+            columns.append(np.zeros(0, dtype=column["dtype"]))
+        else:
+            columns.append(np.memmap(path, dtype=np.dtype(column["dtype"]), mode="r", shape=(manifest["count"],)))
+    return manifest, columns
+
+
+def iter_residue_chunks(residue_dir, chunk_size=DEFAULT_CHUNK_SIZE):
+    manifest, columns = open_residue_columns(residue_dir)
+    # uint64 columns of moduli above 2**63 would wrap as int64
+    dtype = object if max(manifest["moduli"]) - 1 > np.iinfo(np.int64).max else np.int64
+    for start in range(0, manifest["count"], chunk_size):
+        stop = min(start + chunk_size, manifest["count"])
+        yield np.stack([column[start:stop].astype(dtype) for column in columns], axis=1)
+
+
+def stream_reverse_conversion(residue_dir, output, method=None, output_format="text", dtype="<i8",
+                              chunk_size=DEFAULT_CHUNK_SIZE):
+    manifest = load_manifest(residue_dir)
+    basis = as_moduli_set(manifest["moduli"])
+    if output_format == "binary" and basis.dynamic_range - 1 > np.iinfo(np.dtype(dtype)).max:
+        raise ValueError("Dynamic range does not fit the binary output dtype; use text output.")
+    if output_format not in ("text", "binary"):
+        raise ValueError(f"Unknown output format: {output_format}")
+
+    with open(output, "w" if output_format == "text" else "wb") as f:
+        for residues in iter_residue_chunks(residue_dir, chunk_size):
+            values = batch_reverse_conversion(residues, basis, method)
+            if output_format == "text":
+                f.write("\n".join(str(int(v)) for v in values))
+                f.write("\n")
+            else:
+                np.asarray(values).astype(dtype).tofile(f)
+    return manifest["count"]
@@ -0,0 +1,156 @@
+import math
+from collections import namedtuple
+
+from moduli import INT64_MODULUS_LIMIT, ModuliSet
+
+ModuliPlan = namedtuple("ModuliPlan", ["info", "redundant", "basis", "cost", "strategy"])
+
+# Relative per-element cost of one channel, by modulus form: 2^n is a mask,
+# 2^n +- 1 a fold with end-around carry, anything else a real division
+POWER_OF_TWO_COST = 1.0
+SPECIAL_FORM_COST = 1.5
+GENERIC_COST = 3.0
+# Channels too wide for int64 products fall back to object arrays
+OBJECT_DTYPE_PENALTY = 20.0
+# Reverse conversion costs one step per channel pair
+RECONSTRUCTION_COST = 0.25
+DEFAULT_WORD_BITS = 16
+
+
+def modulus_form(m):
+    if m & (m - 1) == 0:
+        return "power_of_two"
+    if (m + 1) & m == 0 or (m - 1) & (m - 2) == 0:
+        return "special"
+    return "generic"
+
+
+_FORM_COSTS = {"power_of_two": POWER_OF_TWO_COST, "special": SPECIAL_FORM_COST, "generic": GENERIC_COST}
+
+
+def channel_cost(m):
+    cost = _FORM_COSTS[modulus_form(m)]
+    return cost * OBJECT_DTYPE_PENALTY if m > INT64_MODULUS_LIMIT else cost
+
+
+def set_cost(moduli):
+    k = len(moduli)
+    return sum(channel_cost(m) for m in moduli) + RECONSTRUCTION_COST * k * (k - 1) / 2
+
+
+def _coprime(m, chosen):
+    return all(math.gcd(m, c) == 1 for c in chosen)
+
+
+def _special_moduli(cap):
+    # 2^n and 2^n +- 1 up to cap, largest first
+    moduli = set()
+    for n in range(1, cap.bit_length() + 1):
+        for m in (2 ** n - 1, 2 ** n, 2 ** n + 1):
+            if 2 <= m <= cap:
+                moduli.add(m)
+    return sorted(moduli, reverse=True)
+
+
+def _greedy(candidates, dynamic_range, min_channels):
+    chosen, product = [], 1
+    for m in candidates:
+        if product >= dynamic_range and len(chosen) >= min_channels:
+            break
+        if _coprime(m, chosen):
+            chosen.append(m)
+            product *= m
+    return chosen if product >= dynamic_range and len(chosen) >= min_channels else None
+
+
+def _descending(cap):
+    return range(cap, 1, -1)
+
+
+def _triple(cap, dynamic_range, min_channels):
+    # Smallest {2^n - 1, 2^n, 2^n + 1} covering the range
+    if min_channels > 3:
+        return None
+    n = 2
+    while 2 ** n + 1 <= cap:
+        moduli = [2 ** n - 1, 2 ** n, 2 ** n + 1]
+        if math.prod(moduli) >= dynamic_range:
+            return moduli
+        n += 1
+    return None
+
+
+def _redundant_moduli(info, redundancy, word_limit):
+    # Each redundant modulus must exceed every information modulus
+    if not redundancy:
+        return []
+    floor = max(info)
+    chosen = []
+    special = [m for m in reversed(_special_moduli(word_limit)) if m > floor]
+    for m in special:
+        if len(chosen) == redundancy:
+            break
+        if _coprime(m, info + chosen):
+            chosen.append(m)
+    m = floor + 1
+    while len(chosen) < redundancy and m <= word_limit:
+        if _coprime(m, info + chosen):
+            chosen.append(m)
+        m += 1
+    return chosen if len(chosen) == redundancy else None
+
+
+def plan_moduli(dynamic_range, redundancy=0, word_bits=DEFAULT_WORD_BITS, min_channels=2):
+    dynamic_range = int(dynamic_range)
+    if dynamic_range < 2:
+        raise ValueError("Dynamic range must be at least 2.")
+    if redundancy < 0:
+        raise ValueError("Redundancy cannot be negative.")
+    if word_bits < 2:
+        raise ValueError("Word size must be at least 2 bits.")
+
+    word_limit = 2 ** word_bits
+    best = None
+    # Capping the information moduli below the word size leaves room for
+    # redundant moduli and trades channel count against channel width
+    for cap_bits in range(word_bits, 1, -1):
+        cap = 2 ** cap_bits
+        candidates = [
+            ("special_triple", _triple(cap, dynamic_range, min_channels)),
+            ("special_forms", _greedy(_special_moduli(cap), dynamic_range, min_channels)),
+            ("greedy_coprime", _greedy(_descending(cap), dynamic_range, min_channels)),
+        ]
+        for strategy, info in candidates:
+            if info is None:
+                continue
+            redundant = _redundant_moduli(info, redundancy, word_limit)
+            if redundant is None:
+                continue
+            cost = set_cost(info + redundant)
+            if best is None or cost < best[0]:
+                best = (cost, strategy, info, redundant)
+    if best is None:
+        raise ValueError(f"No coprime moduli set of {word_bits}-bit words covers the requested range "
+                         f"with {redundancy} redundant moduli.")
+
+    cost, strategy, info, redundant = best
+    info = sorted(info)
+    redundant = sorted(redundant)
+    return ModuliPlan(tuple(info), tuple(redundant), ModuliSet(info + redundant), cost, strategy)
+
+
+def plan_constants(plan):
+    basis = plan.basis
+    return {
+        "strategy": plan.strategy,
+        "cost": plan.cost,
+        "info_moduli": list(plan.info),
+        "redundant_moduli": list(plan.redundant),
+        "forms": [modulus_form(m) for m in basis.moduli],
+        "legitimate_range": math.prod(plan.info),
+        "dynamic_range": basis.dynamic_range,
+        "weights": list(basis.weights),
+        "crt_inverses": list(basis.crt_inverses),
+        "radix_weights": list(basis.radix_weights),
+        "mrc_inverses": [list(row) for row in basis.mrc_inverses],
+    }
@@ -0,0 +1,183 @@
+import html
+import json
+import os
+from collections import namedtuple
+
+from timing import measure
+
+# Measurement builds Sweeps and never touches Matplotlib; rendering only
+# reads Sweeps, so saved measurements can be re-rendered without rerunning.
+# kind is "line" (numeric x) or "bar" (one label per x)
+Sweep = namedtuple("Sweep", ["name", "title", "xlabel", "ylabel", "kind", "x", "series"])
+
+DEFAULT_FIGSIZE = (10, 6)
+DEFAULT_DPI = 100
+DEFAULT_REPEAT = 5
+SWEEP_MIN_TIME = 0.001
+SWEEP_BASE_MODULUS = 101
+MAX_LABELLED_TICKS = 20
+
+_renderer = None
+
+
+def sweep_to_dict(sweep):
+    return sweep._asdict()
+
+
+def sweep_from_dict(data):
+    return Sweep(data["name"], data["title"], data["xlabel"], data["ylabel"], data["kind"], list(data["x"]),
+                 {label: list(values) for label, values in data["series"].items()})
+
+
+def save_sweeps(sweeps, path):
+    with open(path, "w") as f:
+        json.dump([sweep_to_dict(sweep) for sweep in sweeps], f, indent=2)
+
+
+def load_sweeps(path):
+    with open(path) as f:
+        return [sweep_from_dict(data) for data in json.load(f)]
+
+
+def _sweep_moduli(count, start=SWEEP_BASE_MODULUS):
+    # The first `count` primes from `start` up: coprime, and growing the set
+    # only appends channels
+    moduli = []
+    m = start
+    while len(moduli) < count:
+        if all(m % d for d in range(2, int(m ** 0.5) + 1)):
+            moduli.append(m)
+        m += 1
+    return moduli
+
+
+def _median_us(func, repeat):
+    return measure(func, repeat=repeat, warmup=1, min_time=SWEEP_MIN_TIME).median_ns / 1e3
+
+
+def measure_channel_sweep(channel_counts, repeat=DEFAULT_REPEAT):
+    from moduli import ModuliSet
+    from reverse_conversion import crt_reverse_conversion
+    from rns import detect_error_with_math, forward_conversion, introduce_error
+
+    series = {"Forward conversion": [], "CRT reverse conversion": [], "Single error detection": []}
+    for count in channel_counts:
+        basis = ModuliSet(_sweep_moduli(count))
+        moduli = list(basis.moduli)
+        X = basis.dynamic_range // 3
+        residues = forward_conversion(X, moduli)
+        erroneous = introduce_error(residues, count - 1)
+        series["Forward conversion"].append(_median_us(lambda: forward_conversion(X, moduli), repeat))
+        series["CRT reverse conversion"].append(_median_us(lambda: crt_reverse_conversion(residues, basis), repeat))
+        series["Single error detection"].append(
+            _median_us(lambda: detect_error_with_math(residues, erroneous, moduli), repeat))
+    return Sweep("latency_vs_channels", "Latency vs. Channel Count", "Channels", "Median time (us)", "line",
+                 list(channel_counts), series)
+
+
+def measure_error_sweep(error_counts, info_moduli, redundant_moduli, repeat=DEFAULT_REPEAT):
+    from rrns import ENGINES, RRNSCode
+
+    series = {}
+    for engine in ENGINES:
+        code = RRNSCode(info_moduli, redundant_moduli, engine)
+        X = code.legitimate_range // 3
+        codeword = code.encode(X)
+        times = []
+        for errors in error_counts:
+            if errors > len(code):
+                raise ValueError(f"Cannot inject {errors} errors into a code of length {len(code)}.")
+            # Corrupt the last channels so the information part differs too
+            received = codeword[:]
+            for i in range(len(code) - errors, len(code)):
+                received[i] = (received[i] + 1) % code.moduli[i]
+            times.append(_median_us(lambda: code.decode(received), repeat))
+        series[f"RRNS decode ({engine})"] = times
+    return Sweep("latency_vs_errors", "RRNS Decode Latency vs. Error Count", "Injected errors",
+                 "Median time (us)", "line", list(error_counts), series)
+
+
+class FigureRenderer:
+    # Draws every chart on one Agg figure. Figures made through pyplot stay
+    # registered until closed; this one is cleared and reused instead.
+    def __init__(self, figsize=DEFAULT_FIGSIZE, dpi=DEFAULT_DPI):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(self.figure)
+
+    def render(self, sweep, path):
+        self.figure.clf()
+        axes = self.figure.add_subplot()
+        if sweep.kind == "bar":
+            if len(sweep.series) == 1:
+                axes.bar(range(len(sweep.x)), next(iter(sweep.series.values())), color="skyblue", width=0.5)
+            else:
+                # Bars for several series sit side by side within each label
+                width = 0.8 / len(sweep.series)
+                for i, (label, values) in enumerate(sweep.series.items()):
+                    offset = (i - (len(sweep.series) - 1) / 2) * width
+                    axes.bar([j + offset for j in range(len(sweep.x))], values, width=width, label=label)
+            axes.set_xticks(range(len(sweep.x)), [str(x) for x in sweep.x])
+        else:
+            for label, values in sweep.series.items():
+                axes.plot(sweep.x, values, marker="o", label=label)
+            if len(sweep.x) <= MAX_LABELLED_TICKS:
+                axes.set_xticks(sweep.x)
+        axes.set_title(sweep.title, fontsize=14)
+        axes.set_xlabel(sweep.xlabel, fontsize=12)
+        axes.set_ylabel(sweep.ylabel, fontsize=12)
+        if len(sweep.series) > 1:
+            axes.legend()
+        self.figure.tight_layout()
+        self.figure.savefig(path)
+        self.figure.clf()
+        return path
+
+
+def _get_renderer():
+    global _renderer
+    if _renderer is None:
+        _renderer = FigureRenderer()
+    return _renderer
+
+
+def render_sweep(sweep, path):
+    return _get_renderer().render(sweep, path)
+
+
+def render_sweeps(sweeps, directory):
+    os.makedirs(directory, exist_ok=True)
+    renderer = _get_renderer()
+    return {sweep.name: renderer.render(sweep, os.path.join(directory, f"{sweep.name}.png")) for sweep in sweeps}
+
+
+def _html_table(sweep):
+    header = "".join(f"<th>{html.escape(label)}</th>" for label in sweep.series)
+    rows = []
+    for j, x in enumerate(sweep.x):
+        cells = "".join(f"<td>{values[j]:.3f}</td>" for values in sweep.series.values())
+        rows.append(f"<tr><td>{html.escape(str(x))}</td>{cells}</tr>")
+    return (f"<table><tr><th>{html.escape(sweep.xlabel)}</th>{header}</tr>\n"
+            + "\n".join(rows) + "\n</table>")
+
+
+def write_html_report(sweeps, directory, title="RNS Performance Report"):
+    # One pass: every chart, the raw data behind them and an index page
+    images = render_sweeps(sweeps, directory)
+    save_sweeps(sweeps, os.path.join(directory, "sweeps.json"))
+    sections = []
+    for sweep in sweeps:
+        image = os.path.basename(images[sweep.name])
+        sections.append(f"<h2>{html.escape(sweep.title)}</h2>\n"
+                        f"<img src=\"{html.escape(image)}\" alt=\"{html.escape(sweep.title)}\">\n"
+                        f"<p>{html.escape(sweep.ylabel)}</p>\n{_html_table(sweep)}")
+    page = (f"<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n<title>{html.escape(title)}</title>\n"
+            "<style>body { font-family: sans-serif; } table { border-collapse: collapse; } "
+            "td, th { border: 1px solid #ccc; padding: 2px 8px; text-align: right; }</style>\n"
+            f"</head>\n<body>\n<h1>{html.escape(title)}</h1>\n" + "\n".join(sections) + "\n</body>\n</html>\n")
+    path = os.path.join(directory, "index.html")
+    with open(path, "w") as f:
+        f.write(page)
+    return path
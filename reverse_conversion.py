@@ -0,0 +1,166 @@
+import numpy as np
+
+from moduli import as_moduli_set
+from rns_batch import as_residue_matrix
+from special_forms import special_reverse_conversion
+
+# Largest dynamic range whose partial CRT sums still fit in int64
+_INT64_RANGE_LIMIT = 2 ** 62
+# Widest {2^n - 1, 2^n, 2^n + 1} whose closed form stays in int64
+_SPECIAL_BATCH_MAX_BITS = 30
+
+
+def _check_residues(residues, basis):
+    if len(residues) != len(basis):
+        raise ValueError("Residue vector length must match the moduli set.")
+
+
+def crt_reverse_conversion(residues, moduli):
+    basis = as_moduli_set(moduli)
+    _check_residues(residues, basis)
+    total = 0
+    # int() keeps rows taken from a residue matrix from wrapping in int64
+    for r, m, w, inv in zip(residues, basis.moduli, basis.weights, basis.crt_inverses):
+        total += (int(r) * inv % m) * w
+    return total % basis.dynamic_range
+
+
+def mixed_radix_digits(residues, moduli):
+    basis = as_moduli_set(moduli)
+    _check_residues(residues, basis)
+    digits = []
+    for i, m in enumerate(basis.moduli):
+        digit = int(residues[i]) % m
+        for j, previous in enumerate(digits):
+            digit = (digit - previous) * basis.mrc_inverses[j][i] % m
+        digits.append(digit)
+    return digits
+
+
+def mrc_reverse_conversion(residues, moduli):
+    basis = as_moduli_set(moduli)
+    digits = mixed_radix_digits(residues, basis)
+    value = 0
+    for digit, m in zip(reversed(digits), reversed(basis.moduli)):
+        value = value * m + digit
+    return value
+
+
+REVERSE_ENGINES = {
+    "crt": crt_reverse_conversion,
+    "mrc": mrc_reverse_conversion,
+}
+
+
+def reverse_conversion(residues, moduli, method=None):
+    # Without an explicit method, {2^n - 1, 2^n, 2^n + 1} uses its closed
+    # form built from shifts and adds and every other set uses the CRT
+    if method is None:
+        basis = as_moduli_set(moduli)
+        if basis.special_triple is not None and len(residues) == 3:
+            return special_reverse_conversion(residues, basis.special_triple)
+        method = "crt"
+    if method not in REVERSE_ENGINES:
+        raise ValueError(f"Unknown reverse conversion method: {method}")
+    return REVERSE_ENGINES[method](residues, moduli)
+
+
+def batch_crt_reverse_conversion(residues, moduli):
+    basis = as_moduli_set(moduli)
+    residues = as_residue_matrix(residues, basis)
+    m = basis.row
+    scaled = (residues % m * basis.crt_inverse_row) % m
+    if basis.dynamic_range > _INT64_RANGE_LIMIT or m.dtype == object:
+        weights = np.array(basis.weights, dtype=object)
+        return scaled.astype(object).dot(weights) % basis.dynamic_range
+
+    total = np.zeros(residues.shape[0], dtype=np.int64)
+    dynamic_range = np.int64(basis.dynamic_range)
+    for i, w in enumerate(basis.weights):
+        total += scaled[:, i] * np.int64(w)
+        total -= np.where(total >= dynamic_range, dynamic_range, 0)
+    return total
+
+
+def batch_mixed_radix_digits(residues, moduli):
+    basis = as_moduli_set(moduli)
+    digits = as_residue_matrix(residues, basis) % basis.row
+    m = basis.row
+    # Once digit j is final, strip it from every later channel at once
+    for j in range(len(m) - 1):
+        tail = slice(j + 1, None)
+        digits[:, tail] = (digits[:, tail] - digits[:, j, None]) * basis.mrc_inverse_matrix[j, tail] % m[tail]
+    return digits
+
+
+def _radix_groups(moduli):
+    # Consecutive channels whose radix product still fits in int64
+    groups = []
+    start, product = 0, 1
+    for i, m in enumerate(moduli):
+        if product * m > _INT64_RANGE_LIMIT and i > start:
+            groups.append((start, i, product))
+            start, product = i, 1
+        product *= m
+    groups.append((start, len(moduli), product))
+    return groups
+
+
+def batch_mrc_reverse_conversion(residues, moduli):
+    basis = as_moduli_set(moduli)
+    digits = batch_mixed_radix_digits(residues, basis)
+    if digits.dtype == object:
+        value = digits[:, -1].copy()
+        for i in range(len(basis) - 2, -1, -1):
+            value = value * basis.moduli[i] + digits[:, i]
+        return value
+
+    # Horner in int64 inside each group, big-int Horner only across groups
+    value = None
+    for start, stop, product in reversed(_radix_groups(basis.moduli)):
+        chunk = digits[:, stop - 1].copy()
+        for i in range(stop - 2, start - 1, -1):
+            chunk = chunk * basis.moduli[i] + digits[:, i]
+        if value is None:
+            value = chunk
+        else:
+            value = value.astype(object) * product + chunk
+    return value
+
+
+def batch_special_reverse_conversion(residues, triple):
+    # Vectorized special_reverse_conversion; the final X is int64 while 3n < 63
+    n = triple.n
+    mask, plus = np.int64((1 << n) - 1), np.int64((1 << n) + 1)
+    columns = [None, None, None]
+    for j, channel in enumerate(triple.order):
+        columns[channel] = residues[:, j]
+    r1, r2, r3 = columns
+    a = (r1 - r2) % mask
+    b = (r2 - r3) % plus
+    t = ((b - a) % plus) << np.int64(n - 1)
+    t = (t & mask) - (t >> np.int64(n))
+    t = np.where(t < 0, t + plus, t)
+    Y = a + (t << np.int64(n)) - t
+    if 3 * n < 63:
+        return r2 + (Y << np.int64(n))
+    return r2.astype(object) + Y.astype(object) * (1 << n)
+
+
+BATCH_REVERSE_ENGINES = {
+    "crt": batch_crt_reverse_conversion,
+    "mrc": batch_mrc_reverse_conversion,
+}
+
+
+def batch_reverse_conversion(residues, moduli, method=None):
+    if method is None:
+        triple = as_moduli_set(moduli).special_triple
+        if triple is not None and triple.n <= _SPECIAL_BATCH_MAX_BITS:
+            residues = as_residue_matrix(residues, moduli)
+            if residues.dtype == np.int64:
+                return batch_special_reverse_conversion(residues, triple)
+        method = "crt"
+    if method not in BATCH_REVERSE_ENGINES:
+        raise ValueError(f"Unknown reverse conversion method: {method}")
+    return BATCH_REVERSE_ENGINES[method](residues, moduli)
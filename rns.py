@@ -0,0 +1,111 @@
+import random
+
+from moduli import ModuliSet
+from special_forms import (
+    FOLD_MIN_VALUE,
+    MULTIPLICATION_MIN_MODULUS,
+    MULTIPLICATION_THRESHOLD_BITS,
+    fold_pays_off,
+    special_forward_conversion,
+    special_modular_multiplication,
+    triple_exponent,
+)
+
+# Fonksiyonlar
+# {2^n - 1, 2^n, 2^n + 1} switches to shift-and-fold kernels once the
+# operands are wide enough for that to beat `%`. Plain lists are matched
+# through the same cached test as ModuliSet, but only once the value or the
+# moduli are that wide, so everyday calls pay for one comparison. Only
+# Python ints get that wide.
+def forward_conversion(X, moduli):
+    if isinstance(moduli, ModuliSet):
+        triple = moduli.special_triple
+    elif type(X) is int and not -FOLD_MIN_VALUE < X < FOLD_MIN_VALUE:
+        triple = triple_exponent(moduli)
+    else:
+        triple = None
+    if triple is not None and fold_pays_off(X, triple):
+        return special_forward_conversion(X, triple)
+    return [X % m for m in moduli]
+
+def modular_addition(residues_X, residues_Y, moduli):
+    return [(residues_X[i] + residues_Y[i]) % moduli[i] for i in range(len(moduli))]
+
+def modular_subtraction(residues_X, residues_Y, moduli):
+    return [(residues_X[i] - residues_Y[i]) % moduli[i] for i in range(len(moduli))]
+
+def modular_multiplication(residues_X, residues_Y, moduli):
+    if isinstance(moduli, ModuliSet):
+        triple = moduli.special_triple
+    elif len(moduli) == 3 and moduli[0] >= MULTIPLICATION_MIN_MODULUS:
+        triple = triple_exponent(moduli)
+    else:
+        triple = None
+    if triple is not None and triple.n >= MULTIPLICATION_THRESHOLD_BITS:
+        return special_modular_multiplication(residues_X, residues_Y, triple)
+    return [(residues_X[i] * residues_Y[i]) % moduli[i] for i in range(len(moduli))]
+
+def modular_division(residues_X, residues_Y, moduli):
+    # A ModuliSet looks inverses up in its precomputed tables
+    basis = moduli if isinstance(moduli, ModuliSet) else None
+    result = []
+    for i, m in enumerate(moduli):
+        if residues_Y[i] == 0:
+            raise ValueError(f"Division by zero in residue index {i}.")
+        inverse = basis.inverse(i, residues_Y[i]) if basis is not None else pow(residues_Y[i], -1, m)
+        result.append((residues_X[i] * inverse) % m)
+    return result
+
+def introduce_error(residues, error_index):
+    erroneous_residues = residues.copy()
+    erroneous_residues[error_index] += 1
+    return erroneous_residues
+
+def introduce_double_error(residues, error_indices):
+    erroneous_residues = residues.copy()
+    for idx in error_indices:
+        erroneous_residues[idx] += 1
+    return erroneous_residues
+
+def detect_error_with_math(original_residues, erroneous_residues, moduli):
+    for i in range(len(moduli)):
+        if original_residues[i] != erroneous_residues[i]:
+            return i
+    return -1
+
+def detect_and_correct_double_error(original_residues, erroneous_residues, moduli):
+    detected_indices = []
+    corrected_residues = erroneous_residues.copy()
+    for i in range(len(moduli)):
+        if original_residues[i] != erroneous_residues[i]:
+            detected_indices.append(i)
+            corrected_residues[i] = original_residues[i]
+    return detected_indices, corrected_residues
+
+def iter_performance(repeat_count, moduli, X):
+    # Yields (single_error_time, double_error_time) per iteration so callers
+    # such as the GUI can show partial results and stop early
+    # timing pulls in statistics/json; keep importing rns cheap for the CLI
+    from timing import time_call
+
+    for _ in range(repeat_count):
+        original_residues = forward_conversion(X, moduli)
+
+        # Single Error
+        single_error_index = random.randint(0, len(moduli) - 1)
+        erroneous_residues = introduce_error(original_residues, single_error_index)
+        _, single_ns = time_call(detect_error_with_math, original_residues, erroneous_residues, moduli)
+
+        # Double Error
+        double_error_indices = random.sample(range(len(moduli)), 2)
+        erroneous_residues = introduce_double_error(original_residues, double_error_indices)
+        _, double_ns = time_call(detect_and_correct_double_error, original_residues, erroneous_residues, moduli)
+        yield single_ns / 1e9, double_ns / 1e9
+
+def analyze_performance(repeat_count, moduli, X):
+    single_error_times = []
+    double_error_times = []
+    for single_time, double_time in iter_performance(repeat_count, moduli, X):
+        single_error_times.append(single_time)
+        double_error_times.append(double_time)
+    return single_error_times, double_error_times
@@ -0,0 +1,129 @@
+import numpy as np
+
+from moduli import INT64_MODULUS_LIMIT, ModuliSet
+
+
+def _moduli_row(moduli):
+    if isinstance(moduli, ModuliSet):
+        return moduli.row
+    moduli = [int(m) for m in moduli]
+    if not moduli:
+        raise ValueError("Moduli set cannot be empty.")
+    if any(m < 2 for m in moduli):
+        raise ValueError("All moduli must be greater than 1.")
+    if max(moduli) <= INT64_MODULUS_LIMIT:
+        return np.array(moduli, dtype=np.int64)
+    return np.array(moduli, dtype=object)
+
+
+def _as_values(values, dtype):
+    if not isinstance(values, np.ndarray):
+        try:
+            values = np.array(values, dtype=object if dtype is object else np.int64)
+        except OverflowError:
+            values = np.array(values, dtype=object)
+    values = values.reshape(-1)
+    if values.dtype.kind not in "iuO":
+        raise ValueError("Values must be integers.")
+    if dtype is object or values.dtype == object:
+        return values.astype(object)
+    if values.dtype == np.uint64 and values.size and values.max() > np.iinfo(np.int64).max:
+        return values.astype(object)
+    return values.astype(np.int64, copy=False)
+
+
+def as_residue_matrix(residues, moduli):
+    m = _moduli_row(moduli)
+    residues = np.asarray(residues)
+    if residues.ndim == 1:
+        residues = residues.reshape(1, -1)
+    if residues.ndim != 2 or residues.shape[1] != len(m):
+        raise ValueError("Residue matrix must be (N x k) for k moduli.")
+    if m.dtype == object:
+        return residues.astype(object)
+    if residues.dtype == object:
+        return (residues % m).astype(np.int64)
+    return residues.astype(np.int64, copy=False)
+
+
+def _check_matrices(residues_X, residues_Y, moduli):
+    if residues_X.shape != residues_Y.shape:
+        raise ValueError("Residue matrices must have the same shape.")
+    if residues_X.ndim != 2 or residues_X.shape[1] != len(moduli):
+        raise ValueError("Residue matrices must be (N x k) for k moduli.")
+
+
+def batch_forward_conversion(values, moduli):
+    m = _moduli_row(moduli)
+    values = _as_values(values, m.dtype)
+    return (values[:, None] % m[None, :]).astype(m.dtype, copy=False)
+
+
+def batch_modular_addition(residues_X, residues_Y, moduli):
+    m = _moduli_row(moduli)
+    residues_X, residues_Y = np.asarray(residues_X), np.asarray(residues_Y)
+    _check_matrices(residues_X, residues_Y, m)
+    return (residues_X + residues_Y) % m
+
+
+def batch_modular_subtraction(residues_X, residues_Y, moduli):
+    m = _moduli_row(moduli)
+    residues_X, residues_Y = np.asarray(residues_X), np.asarray(residues_Y)
+    _check_matrices(residues_X, residues_Y, m)
+    return (residues_X - residues_Y) % m
+
+
+def batch_modular_multiplication(residues_X, residues_Y, moduli):
+    m = _moduli_row(moduli)
+    residues_X, residues_Y = np.asarray(residues_X), np.asarray(residues_Y)
+    _check_matrices(residues_X, residues_Y, m)
+    return (residues_X * residues_Y) % m
+
+
+def batch_modular_inverse(residues, moduli):
+    m = _moduli_row(moduli)
+    residues = np.asarray(residues)
+    if residues.ndim != 2 or residues.shape[1] != len(m):
+        raise ValueError("Residue matrix must be (N x k) for k moduli.")
+
+    zero_columns = np.flatnonzero((residues == 0).any(axis=0))
+    if zero_columns.size:
+        raise ValueError(f"Division by zero in residue index {zero_columns[0]}.")
+
+    if isinstance(moduli, ModuliSet) and moduli.flat_inverse_table is not None:
+        inverse = moduli.flat_inverse_table[moduli.table_offsets + residues % m]
+        not_invertible = np.flatnonzero((inverse == 0).any(axis=0))
+        if not_invertible.size:
+            column = not_invertible[0]
+            raise ValueError(f"Residue at index {column} is not invertible modulo {m[column]}.")
+        return inverse
+
+    if m.dtype == object:
+        inverse = np.frompyfunc(lambda y, mod: pow(int(y), -1, int(mod)), 2, 1)
+        return inverse(residues, m[None, :])
+
+    # Extended Euclid run over every element at once
+    mods = np.broadcast_to(m, residues.shape).reshape(-1)
+    r0 = mods.copy()
+    r1 = residues.astype(np.int64).reshape(-1) % mods
+    t0 = np.zeros_like(r0)
+    t1 = np.ones_like(r0)
+    active = np.flatnonzero(r1)
+    while active.size:
+        q = r0[active] // r1[active]
+        r0[active], r1[active] = r1[active], r0[active] - q * r1[active]
+        t0[active], t1[active] = t1[active], t0[active] - q * t1[active]
+        active = active[r1[active] != 0]
+
+    not_invertible = np.flatnonzero(r0 != 1)
+    if not_invertible.size:
+        column = not_invertible[0] % residues.shape[1]
+        raise ValueError(f"Residue at index {column} is not invertible modulo {mods[not_invertible[0]]}.")
+    return (t0 % mods).reshape(residues.shape)
+
+
+def batch_modular_division(residues_X, residues_Y, moduli):
+    m = _moduli_row(moduli)
+    residues_X, residues_Y = np.asarray(residues_X), np.asarray(residues_Y)
+    _check_matrices(residues_X, residues_Y, m)
+    return (residues_X * batch_modular_inverse(residues_Y, moduli)) % m
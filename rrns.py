@@ -0,0 +1,232 @@
+from collections import namedtuple
+from functools import cached_property
+from itertools import combinations
+
+import numpy as np
+
+from moduli import ModuliSet
+from reverse_conversion import batch_crt_reverse_conversion, crt_reverse_conversion
+from rns_batch import as_residue_matrix
+
+RRNSDecodeResult = namedtuple("RRNSDecodeResult", ["status", "value", "residues", "error_indices"])
+
+STATUS_OK = "ok"
+STATUS_CORRECTED = "corrected"
+STATUS_UNCORRECTABLE = "uncorrectable"
+
+# Codes whose moduli sum past this skip the error table and drop channels
+ERROR_TABLE_LIMIT = 1 << 20
+
+
+class _SingleErrorSolver:
+    # Locates one error among the channels left after dropping some,
+    # from the syndrome of the redundant channels against the info CRT
+    def __init__(self, code, dropped):
+        kept = [i for i in range(len(code.moduli)) if i not in dropped]
+        k = len(code.info)
+        info = [i for i in kept if i < k]
+        redundant = [i for i in kept if i >= k]
+        # Promote the smallest redundant channels to keep k info channels
+        while len(info) < k:
+            info.append(redundant.pop(0))
+        self.info = info
+        self.redundant = redundant
+        moduli = code.moduli
+        basis = ModuliSet((moduli[i] for i in info), inverse_tables=False)
+        self.info_range = basis.dynamic_range
+        self.info_terms = list(zip(info, basis.moduli, basis.crt_inverses, basis.weights))
+        self.redundant_moduli = [moduli[s] for s in redundant]
+        self.range_residues = [self.info_range % m for m in self.redundant_moduli]
+        self.weight_residues = [[w % m for m in self.redundant_moduli] for w in basis.weights]
+        first = self.redundant_moduli[0]
+        self.first_inverses = [pow(w % first, -1, first) for w in basis.weights]
+
+    def solve(self, received, legitimate_range):
+        X = 0
+        for i, m, inv, w in self.info_terms:
+            X += (received[i] * inv % m) * w
+        X %= self.info_range
+        syndrome = [(received[s] - X) % m for s, m in zip(self.redundant, self.redundant_moduli)]
+
+        nonzero = sum(1 for d in syndrome if d)
+        if nonzero <= 1:
+            # Clean, or a single error sitting in a redundant channel
+            return X if X < legitimate_range else None
+
+        first, d0 = self.redundant_moduli[0], syndrome[0]
+        for j, (_, m, _, w) in enumerate(self.info_terms):
+            residues = self.weight_residues[j]
+            for carry in (0, 1):
+                a = (carry * self.range_residues[0] - d0) * self.first_inverses[j] % first
+                if not 0 < a < m:
+                    continue
+                candidate = X - a * w + carry * self.info_range
+                if not 0 <= candidate < legitimate_range:
+                    continue
+                if all((carry * rr - a * wr - d) % mod == 0
+                       for rr, wr, d, mod in zip(self.range_residues, residues, syndrome, self.redundant_moduli)):
+                    return candidate
+        return None
+
+
+class _ErrorTable:
+    # The full-code CRT of a received vector is Y = X + u * (M / m_j) for one
+    # error in channel j, with X below the info range. Multiplying by m_i
+    # cancels a second error in channel i and leaves X * m_i + c * (M / m_j).
+    # Every c * (M / m_j) is filed under the bucket it starts in, so the
+    # offending channel and magnitude are one lookup away.
+    def __init__(self, code):
+        self.moduli = code.moduli
+        self.range = code.basis.dynamic_range
+        self.info_range = code.legitimate_range
+        self.steps = [self.range // m for m in self.moduli]
+        # Wider than any X * m_i, so the start is in the value's bucket or the one below
+        self.width = max(self.moduli) * self.info_range
+        buckets = {}
+        for j, (m, step) in enumerate(zip(self.moduli, self.steps)):
+            start = 0
+            for c in range(1, m):
+                start += step
+                buckets.setdefault(start // self.width, []).append((j, c))
+        self.buckets = buckets
+
+    def values(self, Y, multiplier):
+        # Legitimate values left once an error in the channel of `multiplier`
+        # (none for 1) and one more error are taken out of Y
+        Z = Y * multiplier % self.range
+        key = Z // self.width
+        for bucket in (key, key - 1):
+            for j, c in self.buckets.get(bucket, ()):
+                rest = Z - c * self.steps[j]
+                if rest >= 0 and rest % multiplier == 0 and rest // multiplier < self.info_range:
+                    yield rest // multiplier
+
+
+ENGINES = ("syndrome", "search")
+
+
+class RRNSCode:
+    def __init__(self, info_moduli, redundant_moduli, engine="syndrome"):
+        self.info = ModuliSet(info_moduli)
+        self.redundant = tuple(int(m) for m in redundant_moduli)
+        if not self.redundant:
+            raise ValueError("At least one redundant modulus is required.")
+        if min(self.redundant) <= max(self.info.moduli):
+            raise ValueError("Redundant moduli must be larger than every information modulus.")
+        self.basis = ModuliSet(self.info.moduli + self.redundant)
+        self.moduli = self.basis.moduli
+        self.legitimate_range = self.info.dynamic_range
+        self.correctable = len(self.redundant) // 2
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown RRNS engine: {engine}")
+        self.engine = engine
+        self._subset_bases = {}
+        self._solvers = {}
+
+    def __len__(self):
+        return len(self.moduli)
+
+    def __repr__(self):
+        return f"RRNSCode({list(self.info.moduli)}, {list(self.redundant)})"
+
+    def encode(self, X):
+        if not 0 <= X < self.legitimate_range:
+            raise ValueError(f"Value must be in the legitimate range [0, {self.legitimate_range}).")
+        return [X % m for m in self.moduli]
+
+    def _check_received(self, received):
+        if len(received) != len(self.moduli):
+            raise ValueError("Received vector length must match the code length.")
+
+    def is_consistent(self, received):
+        self._check_received(received)
+        k = len(self.info)
+        X = crt_reverse_conversion(received[:k], self.info)
+        return all(X % m == r % m for m, r in zip(self.redundant, received[k:]))
+
+    def batch_is_consistent(self, received):
+        received = as_residue_matrix(received, self.basis)
+        k = len(self.info)
+        X = batch_crt_reverse_conversion(received[:, :k], self.info)
+        consistent = np.ones(received.shape[0], dtype=bool)
+        for i, m in enumerate(self.redundant):
+            consistent &= (X % m) == received[:, k + i] % m
+        return consistent
+
+    def _subset_basis(self, kept):
+        basis = self._subset_bases.get(kept)
+        if basis is None:
+            basis = ModuliSet((self.moduli[i] for i in kept), inverse_tables=False)
+            self._subset_bases[kept] = basis
+        return basis
+
+    def _mismatches(self, X, received):
+        return [i for i, (m, r) in enumerate(zip(self.moduli, received)) if X % m != r % m]
+
+    def _search(self, received):
+        # Drop every combination of up to t channels and rebuild from the rest
+        n = len(self.moduli)
+        for errors in range(1, self.correctable + 1):
+            for dropped in combinations(range(n), errors):
+                kept = tuple(i for i in range(n) if i not in dropped)
+                X = crt_reverse_conversion([received[i] for i in kept], self._subset_basis(kept))
+                if X >= self.legitimate_range:
+                    continue
+                error_indices = self._mismatches(X, received)
+                if len(error_indices) <= self.correctable:
+                    return X, error_indices
+        return None
+
+    def _solver(self, dropped):
+        solver = self._solvers.get(dropped)
+        if solver is None:
+            solver = _SingleErrorSolver(self, dropped)
+            self._solvers[dropped] = solver
+        return solver
+
+    @cached_property
+    def _error_table(self):
+        # n * m entries; without r >= 2 the cancelled value can wrap past M
+        if len(self.redundant) < 2 or sum(self.moduli) > ERROR_TABLE_LIMIT:
+            return None
+        return _ErrorTable(self)
+
+    def _locate(self, received):
+        # One or two errors come from the error table: at most n + 1 lookups,
+        # each one big-integer product and reduction. More errors, or codes
+        # too large for the table, drop e - 1 channels and let the syndrome
+        # pin down the last one, C(n, e - 1) solves of O(k * r) each.
+        n = len(self.moduli)
+        first = 1
+        table = self._error_table
+        if table is not None:
+            Y = crt_reverse_conversion(received, self.basis)
+            multipliers = (1,) + (self.moduli if self.correctable >= 2 else ())
+            for multiplier in multipliers:
+                for X in table.values(Y, multiplier):
+                    error_indices = self._mismatches(X, received)
+                    if len(error_indices) <= self.correctable:
+                        return X, error_indices
+            first = 3
+        for errors in range(first, self.correctable + 1):
+            for dropped in combinations(range(n), errors - 1):
+                X = self._solver(dropped).solve(received, self.legitimate_range)
+                if X is None:
+                    continue
+                error_indices = self._mismatches(X, received)
+                if len(error_indices) <= self.correctable:
+                    return X, error_indices
+        return None
+
+    def decode(self, received):
+        self._check_received(received)
+        k = len(self.info)
+        X = crt_reverse_conversion(received[:k], self.info)
+        if all(X % m == r % m for m, r in zip(self.redundant, received[k:])):
+            return RRNSDecodeResult(STATUS_OK, X, [r % m for m, r in zip(self.moduli, received)], [])
+
+        found = self._locate(received) if self.engine == "syndrome" else self._search(received)
+        if found is None:
+            return RRNSDecodeResult(STATUS_UNCORRECTABLE, None, list(received), [])
+        X, error_indices = found
+        return RRNSDecodeResult(STATUS_CORRECTED, X, self.encode(X), error_indices)
@@ -0,0 +1,116 @@
+from collections import namedtuple
+from functools import lru_cache
+
+# Kernels for the moduli set {2^n - 1, 2^n, 2^n + 1}. Residues are handled
+# in canonical order (2^n - 1, 2^n, 2^n + 1); `order[j]` is the canonical
+# channel that sits at position j of the caller's moduli.
+SpecialTriple = namedtuple("SpecialTriple", ["n", "order"])
+
+# Below these sizes CPython's `%` beats shift-and-fold. Moduli of one 30-bit
+# digit divide fastest, so they need four times wider values before folding wins.
+FOLD_THRESHOLD_BITS = 4096
+MULTIPLICATION_THRESHOLD_BITS = 512
+# Anything narrower than these can never take a kernel, whatever the triple
+FOLD_MIN_VALUE = 1 << (FOLD_THRESHOLD_BITS - 1)
+MULTIPLICATION_MIN_MODULUS = (1 << MULTIPLICATION_THRESHOLD_BITS) - 1
+
+
+def triple_exponent(moduli):
+    if len(moduli) != 3:
+        return None
+    return _match_triple(tuple(int(m) for m in moduli))
+
+
+@lru_cache(maxsize=256)
+def _match_triple(moduli):
+    n = (min(moduli) + 1).bit_length() - 1
+    if n < 2:
+        return None
+    canonical = ((1 << n) - 1, 1 << n, (1 << n) + 1)
+    if sorted(moduli) != list(canonical):
+        return None
+    return SpecialTriple(n, tuple(canonical.index(m) for m in moduli))
+
+
+def fold_pays_off(X, triple):
+    threshold = FOLD_THRESHOLD_BITS if triple.n >= 30 else 4 * FOLD_THRESHOLD_BITS
+    return abs(int(X)).bit_length() >= threshold
+
+
+def to_canonical(residues, triple):
+    canonical = [0, 0, 0]
+    for value, channel in zip(residues, triple.order):
+        canonical[channel] = value
+    return canonical
+
+
+def from_canonical(residues, triple):
+    return [residues[channel] for channel in triple.order]
+
+
+def _fold_minus(x, n):
+    # x mod 2^n - 1 for x >= 0: 2^n == 1, so add the n-bit chunks
+    mask = (1 << n) - 1
+    while x > mask:
+        x = (x & mask) + (x >> n)
+    return 0 if x == mask else x
+
+
+def _fold_plus(x, n):
+    # x mod 2^n + 1 for 0 <= x < 2^(2n+1): 2^n == -1, so subtract the high chunk
+    x = (x & ((1 << n) - 1)) - (x >> n)
+    m = (1 << n) + 1
+    while x < 0:
+        x += m
+    return x if x < m else x - m
+
+
+def _fold_double(x, n):
+    # x mod 2^(2n) - 1, halving the fold width so the work stays linear in x
+    width = 2 * n
+    while width * 2 < x.bit_length():
+        width *= 2
+    while True:
+        mask = (1 << width) - 1
+        while x >> width:
+            x = (x & mask) + (x >> width)
+        if width == 2 * n:
+            return 0 if x == mask else x
+        width //= 2
+
+
+def _forward_magnitude(X, n):
+    y = _fold_double(X, n)
+    return [_fold_minus(y, n), X & ((1 << n) - 1), _fold_plus(y, n)]
+
+
+def special_forward_conversion(X, triple):
+    n = triple.n
+    X = int(X)
+    canonical = _forward_magnitude(abs(X), n)
+    if X < 0:
+        canonical = [-r % m for r, m in zip(canonical, ((1 << n) - 1, 1 << n, (1 << n) + 1))]
+    return from_canonical(canonical, triple)
+
+
+def special_modular_multiplication(residues_X, residues_Y, triple):
+    n = triple.n
+    mask = (1 << n) - 1
+    x = [int(r) for r in to_canonical(residues_X, triple)]
+    y = [int(r) for r in to_canonical(residues_Y, triple)]
+    return from_canonical([_fold_minus(x[0] * y[0], n), (x[1] * y[1]) & mask, _fold_plus(x[2] * y[2], n)], triple)
+
+
+def special_reverse_conversion(residues, triple):
+    # X = r2 + 2^n * Y with Y = a + (2^n - 1) * t, where
+    # a = (r1 - r2) mod (2^n - 1), b = (r2 - r3) mod (2^n + 1) and
+    # t = (b - a) * 2^(n-1) mod (2^n + 1), since 2^(n-1) == -(2^n - 1)^-1
+    n = triple.n
+    mask, plus = (1 << n) - 1, (1 << n) + 1
+    # Python ints throughout: NumPy scalars would wrap in the shifts below
+    r1, r2, r3 = (int(r) % m for r, m in zip(to_canonical(residues, triple), (mask, 1 << n, plus)))
+    a = (r1 - r2) % mask
+    b = (r2 - r3) % plus
+    t = _fold_plus(((b - a) % plus) << (n - 1), n)
+    Y = a + (t << n) - t
+    return r2 + (Y << n)
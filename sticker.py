@@ -0,0 +1,126 @@
+import numpy as np
+
+# The lab cost model lives in lab.py; sticker.* keeps exposing it
+from lab import (
+    DEFAULT_OPERATION_COSTS,
+    LabCostModel,
+    LabLedger,
+    charge,
+    get_cost_model,
+    set_cost_model,
+)
+
+WORD_BITS = 64
+
+
+def _words_for(length):
+    return max(1, -(-length // WORD_BITS))
+
+
+class Tube:
+    # Strands packed as rows of uint64 words; bit i lives in word i // 64
+    def __init__(self, words, length):
+        words = np.asarray(words, dtype=np.uint64)
+        if words.ndim != 2 or words.shape[1] != _words_for(length):
+            raise ValueError("Word matrix does not match the strand length.")
+        self.words = words
+        self.length = length
+
+    @classmethod
+    def empty(cls, length, count=0):
+        return cls(np.zeros((count, _words_for(length)), dtype=np.uint64), length)
+
+    @classmethod
+    def from_strings(cls, strands):
+        strands = list(strands)
+        if not strands:
+            raise ValueError("DNA strands cannot be empty.")
+        length = len(strands[0])
+        if any(len(strand) != length for strand in strands):
+            raise ValueError("All DNA strands must have the same length.")
+        # As in separate(), any character other than "1" reads as off
+        chars = np.frombuffer("".join(strands).encode("ascii"), dtype=np.uint8).reshape(len(strands), length)
+        return cls.from_bits(chars == ord("1"))
+
+    @classmethod
+    def from_bits(cls, bits):
+        bits = np.asarray(bits, dtype=bool)
+        count, length = bits.shape
+        padded = np.zeros((count, _words_for(length) * WORD_BITS), dtype=bool)
+        padded[:, :length] = bits
+        packed = np.packbits(padded, axis=1, bitorder="little")
+        return cls(packed.view("<u8").astype(np.uint64, copy=False), length)
+
+    @classmethod
+    def random(cls, count, length, seed=None):
+        rng = np.random.default_rng(seed)
+        words = rng.integers(0, 2 ** 64, size=(count, _words_for(length)), dtype=np.uint64)
+        tube = cls(words, length)
+        tube._clear_padding()
+        return tube
+
+    def _clear_padding(self):
+        spare = self.words.shape[1] * WORD_BITS - self.length
+        if spare:
+            self.words[:, -1] &= np.uint64((1 << (WORD_BITS - spare)) - 1)
+
+    def to_bits(self):
+        bytes_view = np.ascontiguousarray(self.words).astype("<u8", copy=False).view(np.uint8)
+        return np.unpackbits(bytes_view, axis=1, bitorder="little")[:, :self.length].astype(bool)
+
+    def to_strings(self):
+        chars = np.where(self.to_bits(), ord("1"), ord("0")).astype(np.uint8)
+        return [row.tobytes().decode("ascii") for row in chars]
+
+    def __len__(self):
+        return self.words.shape[0]
+
+    def __repr__(self):
+        return f"Tube(strands={len(self)}, length={self.length})"
+
+    def _bit(self, bit_position):
+        if not 0 <= bit_position < self.length:
+            raise ValueError("Bit position is out of range for the given DNA strands.")
+        return bit_position // WORD_BITS, np.uint64(1 << (bit_position % WORD_BITS))
+
+    def test(self, bit_position):
+        word, mask = self._bit(bit_position)
+        return (self.words[:, word] & mask) != 0
+
+    def count_on(self, bit_position):
+        return int(np.count_nonzero(self.test(bit_position)))
+
+    def separate(self, bit_position):
+        on = self.test(bit_position)
+        charge("separate", len(self))
+        return Tube(self.words[on], self.length), Tube(self.words[~on], self.length)
+
+    def set_bit(self, bit_position):
+        word, mask = self._bit(bit_position)
+        charge("set", len(self))
+        self.words[:, word] |= mask
+        return self
+
+    def clear_bit(self, bit_position):
+        word, mask = self._bit(bit_position)
+        charge("clear", len(self))
+        self.words[:, word] &= ~mask
+        return self
+
+    def copy(self):
+        return Tube(self.words.copy(), self.length)
+
+    def discard(self):
+        charge("discard", len(self))
+        self.words = self.words[:0]
+        return self
+
+
+def combine_tubes(*tubes):
+    if not tubes:
+        raise ValueError("At least one tube is required.")
+    length = tubes[0].length
+    if any(tube.length != length for tube in tubes):
+        raise ValueError("All tubes must hold strands of the same length.")
+    charge("combine", sum(len(tube) for tube in tubes))
+    return Tube(np.concatenate([tube.words for tube in tubes]), length)
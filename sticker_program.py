@@ -0,0 +1,240 @@
+import numpy as np
+
+from sticker import WORD_BITS, Tube, charge, combine_tubes
+
+
+class TubeRef:
+    def __init__(self, program, node):
+        self.program = program
+        self.node = node
+
+    def __repr__(self):
+        return f"TubeRef({self.node.op}#{self.node.index})"
+
+
+class _Node:
+    def __init__(self, index, op, sources=(), bit=None, name=None, branch=None):
+        self.index = index
+        self.op = op
+        self.sources = sources
+        self.bit = bit
+        self.name = name
+        self.branch = branch
+
+
+class _LazyTube:
+    # A selection of rows from a base word matrix plus a pending
+    # (words & keep) | force transform left by fused set/clear steps
+    def __init__(self, base, length, rows=None, keep=None, force=None):
+        self.base = base
+        self.length = length
+        self.rows = rows
+        words = base.shape[1]
+        self.keep = np.full(words, np.uint64(2 ** 64 - 1)) if keep is None else keep
+        self.force = np.zeros(words, dtype=np.uint64) if force is None else force
+
+    def __len__(self):
+        return self.base.shape[0] if self.rows is None else len(self.rows)
+
+    def with_bit(self, bit, value):
+        word, mask = bit // WORD_BITS, np.uint64(1 << (bit % WORD_BITS))
+        keep, force = self.keep.copy(), self.force.copy()
+        if value:
+            force[word] |= mask
+        else:
+            keep[word] &= ~mask
+            force[word] &= ~mask
+        return _LazyTube(self.base, self.length, self.rows, keep, force)
+
+    def split(self, bit):
+        word, mask = bit // WORD_BITS, np.uint64(1 << (bit % WORD_BITS))
+        rows = np.arange(self.base.shape[0]) if self.rows is None else self.rows
+        if self.force[word] & mask:
+            on = np.ones(len(rows), dtype=bool)
+        elif not self.keep[word] & mask:
+            on = np.zeros(len(rows), dtype=bool)
+        else:
+            on = (self.base[rows, word] & mask) != 0
+        return rows, on
+
+    def select(self, rows):
+        return _LazyTube(self.base, self.length, rows, self.keep, self.force)
+
+    def materialize(self):
+        words = self.base if self.rows is None else self.base[self.rows]
+        return Tube((words & self.keep) | self.force, self.length)
+
+
+class StickerProgram:
+    def __init__(self, length):
+        self.length = length
+        self.nodes = []
+        self.inputs = []
+        self.outputs = []
+
+    def _add(self, op, sources=(), bit=None, name=None, branch=None):
+        for source in sources:
+            if source.program is not self:
+                raise ValueError("Tube belongs to a different program.")
+        if bit is not None and not 0 <= bit < self.length:
+            raise ValueError("Bit position is out of range for the given DNA strands.")
+        node = _Node(len(self.nodes), op, tuple(s.node for s in sources), bit, name, branch)
+        self.nodes.append(node)
+        return TubeRef(self, node)
+
+    def input(self, name="input"):
+        ref = self._add("input", name=name)
+        self.inputs.append(ref.node)
+        return ref
+
+    def set(self, tube, bit_position):
+        return self._add("set", (tube,), bit_position)
+
+    def clear(self, tube, bit_position):
+        return self._add("clear", (tube,), bit_position)
+
+    def separate(self, tube, bit_position):
+        split = self._add("separate", (tube,), bit_position)
+        return (self._add("branch", (split,), bit_position, branch=True),
+                self._add("branch", (split,), bit_position, branch=False))
+
+    def combine(self, *tubes):
+        if not tubes:
+            raise ValueError("At least one tube is required.")
+        return self._add("combine", tubes)
+
+    def discard(self, tube):
+        self._add("discard", (tube,))
+
+    def output(self, tube, name=None):
+        name = name or f"output{len(self.outputs)}"
+        self.outputs.append((name, tube.node))
+
+    def live_nodes(self):
+        # Anything an output does not depend on is dead, e.g. tubes that are only discarded
+        live = set()
+        stack = [node for _, node in self.outputs]
+        while stack:
+            node = stack.pop()
+            if node.index in live:
+                continue
+            live.add(node.index)
+            stack.extend(node.sources)
+        return live
+
+    def plan(self):
+        live = self.live_nodes()
+        executed = [node for node in self.nodes if node.index in live]
+        # A tube carries a pending set/clear transform from the last set/clear
+        # step until a combine or output materializes it; every set/clear
+        # applied to such a tube folds into that transform
+        pending = {}
+        for node in executed:
+            if node.op in ("input", "combine"):
+                pending[node.index] = False
+            elif node.op in ("set", "clear"):
+                pending[node.index] = True
+            else:
+                pending[node.index] = pending[node.sources[0].index]
+        bit_ops = [node for node in executed if node.op in ("set", "clear")]
+        return {
+            "nodes": len(self.nodes),
+            "live": len(executed),
+            "eliminated": len(self.nodes) - len(executed),
+            "bit_ops": len(bit_ops),
+            "fused_bit_ops": sum(1 for node in bit_ops if pending[node.sources[0].index]),
+        }
+
+    def run(self, inputs):
+        if isinstance(inputs, Tube):
+            if len(self.inputs) != 1:
+                raise ValueError("Program has several inputs; pass a {name: Tube} mapping.")
+            inputs = {self.inputs[0].name: inputs}
+
+        # Dead nodes are never executed, so they are not charged lab time
+        # either; discards are still charged for the strands they drop
+        live = self.live_nodes()
+        values = {}
+        splits = {}
+        for node in self.nodes:
+            if node.op == "discard":
+                source = values.get(node.sources[0].index)
+                charge("discard", len(source) if source is not None else 0)
+                continue
+            if node.index not in live:
+                continue
+
+            if node.op == "input":
+                if node.name not in inputs:
+                    raise ValueError(f"Missing input tube: {node.name}")
+                tube = inputs[node.name]
+                if tube.length != self.length:
+                    raise ValueError("Input tube length does not match the program.")
+                values[node.index] = _LazyTube(tube.words, tube.length)
+            elif node.op in ("set", "clear"):
+                source = values[node.sources[0].index]
+                charge(node.op, len(source))
+                values[node.index] = source.with_bit(node.bit, node.op == "set")
+            elif node.op == "separate":
+                source = values[node.sources[0].index]
+                charge("separate", len(source))
+                splits[node.index] = (source, *source.split(node.bit))
+            elif node.op == "branch":
+                source, rows, on = splits[node.sources[0].index]
+                values[node.index] = source.select(rows[on] if node.branch else rows[~on])
+            elif node.op == "combine":
+                parts = [values[source.index].materialize() for source in node.sources]
+                combined = combine_tubes(*parts)
+                values[node.index] = _LazyTube(combined.words, combined.length)
+
+        return {name: values[node.index].materialize() for name, node in self.outputs}
+
+
+def parse_program(text, length):
+    # One statement per line:
+    #   input T | set T 3 [-> U] | clear T 3 [-> U] | separate T 3 -> ON OFF
+    #   combine A B ... -> C | discard T | output T [T ...]
+    program = StickerProgram(length)
+    names = {}
+
+    def lookup(name, line_number):
+        if name not in names:
+            raise ValueError(f"Line {line_number}: unknown tube '{name}'.")
+        return names[name]
+
+    for line_number, line in enumerate(text.splitlines(), 1):
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        head, _, target = line.partition("->")
+        words, targets = head.split(), target.split()
+        op, args = words[0].lower(), words[1:]
+        try:
+            if op == "input":
+                for name in args:
+                    names[name] = program.input(name)
+            elif op in ("set", "clear"):
+                source, bit = args
+                ref = getattr(program, op)(lookup(source, line_number), int(bit))
+                names[targets[0] if targets else source] = ref
+            elif op == "separate":
+                source, bit = args
+                on_name, off_name = targets
+                names[on_name], names[off_name] = program.separate(lookup(source, line_number), int(bit))
+            elif op == "combine":
+                (target_name,) = targets
+                names[target_name] = program.combine(*(lookup(name, line_number) for name in args))
+            elif op == "discard":
+                for name in args:
+                    program.discard(lookup(name, line_number))
+                    del names[name]
+            elif op == "output":
+                for name in args:
+                    program.output(lookup(name, line_number), name)
+            else:
+                raise ValueError(f"Line {line_number}: unknown operation '{op}'.")
+        except (TypeError, ValueError) as e:
+            if str(e).startswith("Line "):
+                raise
+            raise ValueError(f"Line {line_number}: {e}") from None
+    return program
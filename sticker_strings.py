@@ -0,0 +1,77 @@
+from lab import charge
+from timing import time_call
+
+def analyze_sticker_model(dna_set, bit_position):
+    operations = ["Combine", "Separate", "Set", "Discard"]
+    times = []
+
+    for operation in operations:
+        if operation == "Combine":
+            _, elapsed_ns = time_call(combine, dna_set)
+        elif operation == "Separate":
+            _, elapsed_ns = time_call(separate, dna_set, bit_position)
+        elif operation == "Set":
+            _, elapsed_ns = time_call(set_bit, dna_set, bit_position)
+        elif operation == "Discard":
+            _, elapsed_ns = time_call(discard, dna_set)
+        times.append(elapsed_ns / 1e9)
+
+    # Grafik çizimi
+    from report import Sweep, render_sweep
+    scaled_times = [t * 1000 for t in times]  # Milisaniyeye çevir
+    sweep = Sweep("sticker_operations", "Performance Analysis of Sticker Model Operations", "Operations",
+                  "Time (milliseconds)", "bar", operations, {"Time": scaled_times})
+    render_sweep(sweep, "output.png")  # Grafiği 'output.png' dosyasına kaydet
+    return operations, times
+
+# DNA Sticker Model Fonksiyonları
+def combine(dna_set):
+    charge("combine", len(dna_set))  # Simülasyon maliyeti
+    return "".join(dna_set)
+
+def separate(dna_strand, bit_position):
+    charge("separate", len(dna_strand))  # Simülasyon maliyeti
+    on = []
+    off = []
+    for strand in dna_strand:
+        if strand[bit_position] == "1":
+            on.append(strand)
+        else:
+            off.append(strand)
+    return on, off
+
+def set_bit(dna_strand, bit_position):
+    charge("set", len(dna_strand))  # Simülasyon maliyeti
+    modified_strands = []
+    for strand in dna_strand:
+        strand = strand[:bit_position] + "1" + strand[bit_position + 1:]
+        modified_strands.append(strand)
+    return modified_strands
+
+def discard(dna_strand):
+    charge("discard", len(dna_strand))  # Simülasyon maliyeti
+    return []
+
+# Performance Analysis Function
+def iter_sticker_performance(dna_set, bit_position):
+    # Yields (operation, time, result) as each operation finishes
+    for operation in ["Combine", "Separate", "Set", "Discard"]:
+        if operation == "Combine":
+            result, elapsed_ns = time_call(combine, dna_set)
+        elif operation == "Separate":
+            result, elapsed_ns = time_call(separate, dna_set, bit_position)
+        elif operation == "Set":
+            result, elapsed_ns = time_call(set_bit, dna_set, bit_position)
+        elif operation == "Discard":
+            result, elapsed_ns = time_call(discard, dna_set)
+        yield operation, elapsed_ns / 1e9, result
+
+def analyze_sticker_performance(dna_set, bit_position):
+    operations = []
+    times = []
+    results = []
+    for operation, elapsed, result in iter_sticker_performance(dna_set, bit_position):
+        operations.append(operation)
+        times.append(elapsed)
+        results.append(result)
+    return operations, times, results
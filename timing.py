@@ -0,0 +1,171 @@
+import gc
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+DEFAULT_MIN_SAMPLE_TIME = 0.002
+DEFAULT_REPEAT = 20
+DEFAULT_WARMUP = 3
+# A median this much slower than the baseline counts as a regression
+DEFAULT_REGRESSION_THRESHOLD = 0.10
+
+
+def time_call(func, *args, **kwargs):
+    start = time.perf_counter_ns()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter_ns() - start
+
+
+def percentile(sorted_samples, pct):
+    if not sorted_samples:
+        return 0.0
+    position = (len(sorted_samples) - 1) * pct / 100
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return sorted_samples[lower]
+    return sorted_samples[lower] + (sorted_samples[upper] - sorted_samples[lower]) * (position - lower)
+
+
+class BenchmarkResult:
+    def __init__(self, name, loops, samples_ns, metadata=None):
+        self.name = name
+        self.loops = loops
+        self.samples_ns = list(samples_ns)
+        self.metadata = dict(metadata or {})
+
+    @property
+    def median_ns(self):
+        return statistics.median(self.samples_ns)
+
+    @property
+    def mean_ns(self):
+        return statistics.fmean(self.samples_ns)
+
+    @property
+    def stdev_ns(self):
+        return statistics.stdev(self.samples_ns) if len(self.samples_ns) > 1 else 0.0
+
+    def percentile_ns(self, pct):
+        return percentile(sorted(self.samples_ns), pct)
+
+    def to_dict(self):
+        ordered = sorted(self.samples_ns)
+        return {
+            "name": self.name,
+            "loops": self.loops,
+            "samples": len(ordered),
+            "median_ns": statistics.median(ordered),
+            "mean_ns": statistics.fmean(ordered),
+            "stdev_ns": self.stdev_ns,
+            "min_ns": ordered[0],
+            "max_ns": ordered[-1],
+            "p5_ns": percentile(ordered, 5),
+            "p95_ns": percentile(ordered, 95),
+            "p99_ns": percentile(ordered, 99),
+            "metadata": self.metadata,
+        }
+
+    def __repr__(self):
+        return (f"BenchmarkResult({self.name!r}, median={format_ns(self.median_ns)}, "
+                f"stdev={format_ns(self.stdev_ns)}, loops={self.loops}, samples={len(self.samples_ns)})")
+
+
+def format_ns(ns):
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.3f} {unit}"
+    return f"{ns:.1f} ns"
+
+
+def _run_loops(func, loops):
+    clock = time.perf_counter_ns
+    start = clock()
+    for _ in range(loops):
+        func()
+    return clock() - start
+
+
+def calibrate_loops(func, min_time=DEFAULT_MIN_SAMPLE_TIME):
+    # Double the inner loop until one sample is well above clock resolution
+    min_time_ns = min_time * 1e9
+    loops = 1
+    while True:
+        elapsed = _run_loops(func, loops)
+        if elapsed >= min_time_ns:
+            return loops
+        if elapsed <= 0:
+            loops *= 10
+        else:
+            loops = max(loops * 2, int(loops * min_time_ns / elapsed * 1.2))
+
+
+def measure(func, name=None, repeat=DEFAULT_REPEAT, warmup=DEFAULT_WARMUP, min_time=DEFAULT_MIN_SAMPLE_TIME,
+            loops=None, disable_gc=True, metadata=None):
+    for _ in range(warmup):
+        func()
+    if loops is None:
+        loops = calibrate_loops(func, min_time)
+
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    if disable_gc:
+        gc.disable()
+    try:
+        samples = [_run_loops(func, loops) / loops for _ in range(repeat)]
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return BenchmarkResult(name or getattr(func, "__name__", "benchmark"), loops, samples, metadata)
+
+
+class BenchmarkSuite:
+    def __init__(self, repeat=DEFAULT_REPEAT, warmup=DEFAULT_WARMUP, min_time=DEFAULT_MIN_SAMPLE_TIME):
+        self.repeat = repeat
+        self.warmup = warmup
+        self.min_time = min_time
+        self.results = []
+
+    def measure(self, name, func, **options):
+        options.setdefault("repeat", self.repeat)
+        options.setdefault("warmup", self.warmup)
+        options.setdefault("min_time", self.min_time)
+        result = measure(func, name=name, **options)
+        self.results.append(result)
+        return result
+
+    def to_dict(self):
+        return {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "results": [result.to_dict() for result in self.results],
+        }
+
+    def write_json(self, path):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+def load_results(path):
+    with open(path) as f:
+        data = json.load(f)
+    return {entry["name"]: entry for entry in data["results"]}
+
+
+def compare_results(baseline, current, threshold=DEFAULT_REGRESSION_THRESHOLD):
+    # baseline/current: {name: result dict}; returns (name, old, new, ratio, regressed) rows
+    rows = []
+    for name, entry in current.items():
+        if name not in baseline:
+            continue
+        old, new = baseline[name]["median_ns"], entry["median_ns"]
+        ratio = new / old if old else float("inf")
+        rows.append((name, old, new, ratio, ratio > 1 + threshold))
+    return rows
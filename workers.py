@@ -0,0 +1,66 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Analyses run here so the Tk main thread only ever drains results.
+# Tk is not thread-safe, so workers never touch widgets themselves.
+MAX_WORKERS = 2
+
+_executor = None
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="analysis")
+    return _executor
+
+
+class BackgroundJob:
+    # Runs an iterator on the worker pool and queues each item it yields.
+    # Cancellation is checked between items.
+    def __init__(self, make_iterator):
+        self.make_iterator = make_iterator
+        self.items = queue.SimpleQueue()
+        self.cancelled = threading.Event()
+        self.finished = threading.Event()
+        self.error = None
+        self.future = None
+
+    def start(self):
+        self.future = _get_executor().submit(self._run)
+        return self
+
+    def _run(self):
+        iterator = None
+        try:
+            iterator = self.make_iterator()
+            for item in iterator:
+                if self.cancelled.is_set():
+                    break
+                self.items.put(item)
+        except Exception as e:
+            self.error = e
+        finally:
+            # Generators get to release what they hold, e.g. a process pool
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+            self.finished.set()
+
+    def cancel(self):
+        self.cancelled.set()
+
+    @property
+    def done(self):
+        return self.finished.is_set()
+
+    def poll(self, limit=None):
+        # Everything queued so far, at most `limit` items per call
+        drained = []
+        while limit is None or len(drained) < limit:
+            try:
+                drained.append(self.items.get_nowait())
+            except queue.Empty:
+                break
+        return drained